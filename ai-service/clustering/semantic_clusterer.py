@@ -3,6 +3,7 @@ Semantic Clustering Service for Research Papers
 Provides AI-powered paper grouping and topic modeling
 """
 
+import threading
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from sklearn.cluster import KMeans, DBSCAN
@@ -13,11 +14,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Loaded sentence-transformer models, shared by every clusterer in the process
+_models: Dict[str, SentenceTransformer] = {}
+_models_lock = threading.Lock()
+
+
+def _load_model(model_name: str) -> SentenceTransformer:
+    """Load a model once per process; concurrent first callers wait for the same load"""
+    with _models_lock:
+        model = _models.get(model_name)
+        if model is None:
+            model = _models[model_name] = SentenceTransformer(model_name)
+        return model
+
 class SemanticClusterer:
     """AI-powered semantic clustering for research papers"""
     
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
-        self.model = SentenceTransformer(model_name)
+        self.model = _load_model(model_name)
         self.embeddings_cache = {}
         
     def generate_embeddings(self, texts: List[str]) -> np.ndarray:
@@ -29,17 +43,24 @@ class SemanticClusterer:
             logger.error(f"Error generating embeddings: {e}")
             raise
     
+    def embed(self, papers: List[Dict[str, Any]]) -> np.ndarray:
+        """Generate the title + abstract embedding matrix for papers"""
+        texts = [f"{paper.get('title', '')} {paper.get('abstract', '')}" 
+                for paper in papers]
+        return self.generate_embeddings(texts)
+    
     def cluster_papers(self, papers: List[Dict[str, Any]], 
                       method: str = "kmeans", 
-                      n_clusters: Optional[int] = None) -> Dict[str, Any]:
-        """Cluster papers using semantic similarity"""
+                      n_clusters: Optional[int] = None,
+                      embeddings: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Cluster papers using semantic similarity
+        
+        Pass a precomputed ``embeddings`` matrix (see ``embed``) to skip encoding.
+        """
         try:
-            # Extract text for clustering
-            texts = [f"{paper.get('title', '')} {paper.get('abstract', '')}" 
-                    for paper in papers]
-            
-            # Generate embeddings
-            embeddings = self.generate_embeddings(texts)
+            # Generate embeddings unless the caller already has them
+            if embeddings is None:
+                embeddings = self.embed(papers)
             
             # Perform clustering
             if method == "kmeans":
@@ -60,14 +60,44 @@ class TrendAnalyzer:
     
     def _group_papers_by_year(self, papers: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
         """Group papers by publication year"""
-        papers_by_year = defaultdict(list)
-        
-        for paper in papers:
-            year = paper.get('published_year')
-            if year and isinstance(year, int) and 2000 <= year <= 2024:
-                papers_by_year[year].append(paper)
+        return self.group_papers_by_year(papers, min_year=2000, max_year=2024)
+    
+    def group_papers_by_year(self, papers: List[Dict[str, Any]], 
+                           min_year: Optional[int] = None, 
+                           max_year: Optional[int] = None) -> Dict[int, List[Dict[str, Any]]]:
+        """Group papers by publication year using a sorted group-by over the year array"""
+        view = self._corpus_view(papers)
+        years = view["years"]
+        
+        keep = years > 0
+        if min_year is not None:
+            keep &= years >= min_year
+        if max_year is not None:
+            keep &= years <= max_year
+        
+        ids = view["ids"][keep]
+        years = years[keep]
+        
+        # Stable sort keeps the original paper order within each year
+        order = np.argsort(years, kind="stable")
+        sorted_years = years[order]
+        sorted_ids = ids[order]
+        unique_years, starts = np.unique(sorted_years, return_index=True)
+        bounds = np.append(starts, len(sorted_years))
         
-        return dict(papers_by_year)
+        return {
+            int(year): [papers[i] for i in sorted_ids[start:end]]
+            for year, start, end in zip(unique_years, bounds[:-1], bounds[1:])
+        }
+    
+    def _corpus_view(self, papers: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Build a structure-of-arrays view (row index, year) of the corpus"""
+        years = np.fromiter(
+            (year if isinstance(year, int) else 0
+             for year in (paper.get('published_year') for paper in papers)),
+            dtype=np.int16, count=len(papers)
+        )
+        return {"ids": np.arange(len(papers)), "years": years}
     
     def _analyze_keyword_trends(self, papers_by_year: Dict[int, List[Dict[str, Any]]], 
                               time_window: int) -> Dict[str, Any]:
@@ -30,8 +30,8 @@ class PaperSummarizer:
         # Initialize LLM with LiteLLM support
         import sys
         import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
-        from core.llm_config import get_llm_client
+        sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+        from backend.core.llm_config import get_llm_client
         self.llm = get_llm_client(
             model_name=model_name,
             temperature=0.1,
@@ -1,6 +1,7 @@
 """AI Agent management endpoints."""
 
 from typing import List, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
@@ -12,12 +13,11 @@ from ....models.agent_models import (
 )
 from ....models.common_models import PaginationParams, PaginatedResponse
 from ....services.agent_service import AgentService
-from ....services.websocket_service import WebSocketManager
+from ....services.websocket_service import websocket_manager, encode_json
 from ....core.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
-websocket_manager = WebSocketManager()
 
 
 @router.post("/", response_model=AgentResponse, status_code=201)
@@ -277,18 +277,18 @@ async def agent_chat_websocket(
         
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             
             # Process query through agent
             query_request = AgentQueryRequest(**data)
             response = await agent_service.query_agent(agent_id, query_request)
             
             # Send response back to client
-            await websocket.send_json({
+            await websocket.send_text(encode_json({
                 "type": "agent_response",
                 "data": response.dict(),
-                "timestamp": response.created_at.isoformat()
-            })
+                "timestamp": response.created_at
+            }))
             
     except WebSocketDisconnect:
         logger.info("websocket_disconnected", agent_id=agent_id, user_id=user_id)
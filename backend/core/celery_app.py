@@ -1,8 +1,24 @@
 """Celery application configuration."""
 
 import os
+import orjson
 from celery import Celery
 from celery.schedules import crontab
+from kombu.serialization import register
+
+
+def _orjson_dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS)
+
+
+# Task results can carry large lists of analyses/errors; encode them with orjson
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8"
+)
 
 # Create Celery instance
 celery_app = Celery(
@@ -18,8 +34,9 @@ celery_app = Celery(
 # Celery configuration
 celery_app.conf.update(
     task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
+    result_accept_content=["orjson", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
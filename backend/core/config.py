@@ -90,6 +90,18 @@ class Settings(BaseSettings):
     def is_development(self) -> bool:
         return self.environment.lower() == "development"
     
+    @property
+    def async_database_url(self) -> str:
+        """Database URL with the async driver for the configured backend."""
+        url = self.database_url
+        if url.startswith("sqlite:"):
+            return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+        if url.startswith("postgresql://"):
+            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        if url.startswith("postgres://"):
+            return url.replace("postgres://", "postgresql+asyncpg://", 1)
+        return url
+    
     @property
     def database_config(self) -> dict:
         """Database configuration based on environment"""
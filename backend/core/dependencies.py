@@ -1,11 +1,13 @@
 """Dependency injection for FastAPI."""
 
 from functools import lru_cache
-from typing import Generator
+from typing import Generator, Optional
 import os
 
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..database.connection import get_db_session
+from ..database.connection import get_db_session, get_async_db_session
 from ..repositories.paper_repository import PaperRepository
 from ..repositories.agent_repository import AgentRepository
 from ..services.paper_service import PaperService
@@ -76,25 +78,43 @@ def get_agent_service(
     return AgentService(agent_repository, agent_domain)
 
 
-def get_user_service() -> UserService:
-    """Get user service instance."""
-    return UserService()
+def get_user_service(db: AsyncSession = Depends(get_async_db_session)) -> UserService:
+    """Get user service instance bound to a pooled async session."""
+    return UserService(db)
+
+
+_data_pipeline_service: Optional[DataPipelineService] = None
 
 
 def get_data_pipeline_service(
     paper_repository: PaperRepository = None,
     paper_domain: PaperDomain = None
 ) -> DataPipelineService:
-    """Get data pipeline service instance."""
-    if paper_repository is None:
-        paper_repository = get_paper_repository()
-    if paper_domain is None:
-        paper_domain = get_paper_domain()
-    
-    # Get GitHub token from environment
-    github_token = os.getenv("GITHUB_TOKEN")
+    """Get the process-wide data pipeline service.
     
-    return DataPipelineService(paper_repository, paper_domain, github_token)
+    Its clients hold pooled HTTP sessions, so one instance is shared and
+    closed on shutdown with ``close_data_pipeline_service``.
+    """
+    global _data_pipeline_service
+    if _data_pipeline_service is None:
+        if paper_repository is None:
+            paper_repository = get_paper_repository()
+        if paper_domain is None:
+            paper_domain = get_paper_domain()
+        
+        # Get GitHub token from environment
+        github_token = os.getenv("GITHUB_TOKEN")
+        
+        _data_pipeline_service = DataPipelineService(paper_repository, paper_domain, github_token)
+    return _data_pipeline_service
+
+
+async def close_data_pipeline_service():
+    """Close the shared pipeline service's HTTP sessions and parse workers."""
+    global _data_pipeline_service
+    service, _data_pipeline_service = _data_pipeline_service, None
+    if service is not None:
+        await service.close()
 
 
 def get_ai_agent_service(
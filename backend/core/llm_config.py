@@ -1,51 +1,183 @@
 """LLM configuration with LiteLLM support."""
 
+import asyncio
+import hashlib
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
+import httpx
+import openai
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 
+# Connection pool shared by every OpenAI-compatible client, so repeated
+# requests to the same provider reuse warm TCP/TLS connections
+_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(120, connect=10)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+@dataclass(frozen=True)
+class _LLMSettings:
+    """Provider settings read from the environment."""
+    use_litellm: bool
+    litellm_api_key: Optional[str]
+    litellm_base_url: Optional[str]
+    openai_api_key: Optional[str]
+    anthropic_api_key: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _llm_settings() -> _LLMSettings:
+    """Read provider settings once instead of on every client construction."""
+    return _LLMSettings(
+        use_litellm=os.getenv("USE_LITELLM", "false").lower() == "true",
+        litellm_api_key=os.getenv("LITELLM_API_KEY"),
+        litellm_base_url=os.getenv("LITELLM_BASE_URL"),
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY")
+    )
+
+
+def reload_llm_settings():
+    """Re-read provider settings after the environment changed (e.g. in tests)."""
+    _llm_settings.cache_clear()
+    _cached_llm_client.cache_clear()
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Lazily create the shared async connection pool."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return _http_client
+
+
+async def prewarm_llm_connection(base_url: str, timeout: float = 2.0):
+    """Open a keep-alive connection to ``base_url`` ahead of the first real request.
+    
+    Best effort: failures are ignored and the first request connects itself.
+    """
+    try:
+        await asyncio.wait_for(_shared_http_client().head(base_url), timeout)
+    except Exception:
+        pass
+
+
+async def close_llm_http_client():
+    """Close the shared connection pool and drop the clients that use it."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _cached_llm_client.cache_clear()
+
+
+def _key_fingerprint(settings: _LLMSettings) -> str:
+    """Short digest of the API keys, so client cache keys never hold them in plaintext."""
+    keys = (settings.litellm_api_key, settings.openai_api_key, settings.anthropic_api_key)
+    return hashlib.blake2b("\0".join(key or "" for key in keys).encode(), digest_size=8).hexdigest()
+
 
 def get_llm_client(
     model_name: str = "gpt-3.5-turbo",
     temperature: float = 0.1,
     max_tokens: int = 1000
 ):
-    """Get LLM client with LiteLLM support."""
+    """Get LLM client with LiteLLM support.
     
-    use_litellm = os.getenv("USE_LITELLM", "false").lower() == "true"
+    Clients are shared between calls with the same model, sampling settings
+    and provider configuration, so their HTTP connection pools are reused.
+    """
+    settings = _llm_settings()
+    return _cached_llm_client(
+        model_name,
+        temperature,
+        max_tokens,
+        settings.use_litellm,
+        settings.litellm_base_url,
+        _key_fingerprint(settings)
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_llm_client(
+    model_name: str,
+    temperature: float,
+    max_tokens: int,
+    use_litellm: bool,
+    litellm_base_url: Optional[str],
+    key_fingerprint: str
+):
+    """Build a client; the provider settings in the arguments only key the cache."""
+    settings = _llm_settings()
     
     if use_litellm:
         # Use LiteLLM configuration
-        return ChatOpenAI(
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            openai_api_key=os.getenv("LITELLM_API_KEY"),
-            openai_api_base=os.getenv("LITELLM_BASE_URL", "https://api.litellm.ai/v1")
+        return _chat_openai(
+            model_name,
+            temperature,
+            max_tokens,
+            api_key=settings.litellm_api_key,
+            api_base=(
+                settings.litellm_base_url
+                if settings.litellm_base_url is not None
+                else "https://api.litellm.ai/v1"
+            )
         )
     
     # Standard provider configuration
     if model_name.startswith("gpt") or model_name.startswith("text-"):
-        return ChatOpenAI(
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            openai_api_key=os.getenv("OPENAI_API_KEY")
+        return _chat_openai(
+            model_name,
+            temperature,
+            max_tokens,
+            api_key=settings.openai_api_key
         )
     elif model_name.startswith("claude"):
         return ChatAnthropic(
             model=model_name,
             temperature=temperature,
             max_tokens=max_tokens,
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY")
+            anthropic_api_key=settings.anthropic_api_key
         )
     else:
         # Default to OpenAI-compatible via LiteLLM
-        return ChatOpenAI(
-            model=model_name,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            openai_api_key=os.getenv("LITELLM_API_KEY") if use_litellm else os.getenv("OPENAI_API_KEY"),
-            openai_api_base=os.getenv("LITELLM_BASE_URL") if use_litellm else None
-        )
\ No newline at end of file
+        return _chat_openai(
+            model_name,
+            temperature,
+            max_tokens,
+            api_key=settings.litellm_api_key if use_litellm else settings.openai_api_key,
+            api_base=settings.litellm_base_url if use_litellm else None
+        )
+
+
+def _chat_openai(
+    model_name: str,
+    temperature: float,
+    max_tokens: int,
+    api_key: Optional[str],
+    api_base: Optional[str] = None
+) -> ChatOpenAI:
+    """Build a ChatOpenAI whose async requests go through the shared connection pool."""
+    kwargs = {}
+    if api_key:
+        # Without a key ChatOpenAI resolves (or rejects) credentials itself
+        kwargs["async_client"] = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=api_base or os.getenv("OPENAI_API_BASE"),
+            timeout=_HTTP_TIMEOUT,
+            http_client=_shared_http_client()
+        ).chat.completions
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        openai_api_key=api_key,
+        openai_api_base=api_base,
+        **kwargs
+    )
+
+
+get_llm_client.cache_clear = _cached_llm_client.cache_clear
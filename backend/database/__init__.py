@@ -1,11 +1,12 @@
 """Database module for SQLAlchemy and Neo4j integration."""
 
-from .connection import DatabaseManager, get_db_session, get_neo4j_session
+from .connection import DatabaseManager, get_db_session, get_async_db_session, get_neo4j_session
 from .models import Base
 
 __all__ = [
     "DatabaseManager",
     "get_db_session", 
+    "get_async_db_session",
     "get_neo4j_session",
     "Base"
 ]
\ No newline at end of file
@@ -2,14 +2,16 @@
 Database connection management for SQLAlchemy and Neo4j.
 Supports SQLite (POC) to PostgreSQL (Production) migration.
 """
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional
 from contextlib import contextmanager
 from sqlalchemy import create_engine, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from neo4j import GraphDatabase, Driver, Session as Neo4jSession
 import redis
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from ..core.config import settings
 from ..core.logging import get_logger
@@ -23,8 +25,11 @@ class DatabaseManager:
     def __init__(self):
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_session_factory: Optional[async_sessionmaker] = None
         self._neo4j_driver: Optional[Driver] = None
         self._redis_client: Optional[Redis] = None
+        self._async_redis_client: Optional[AsyncRedis] = None
     
     @property
     def engine(self) -> Engine:
@@ -44,6 +49,29 @@ class DatabaseManager:
             )
         return self._session_factory
     
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """Get async SQLAlchemy engine (lazy initialization)."""
+        if self._async_engine is None:
+            self._async_engine = create_async_engine(
+                settings.async_database_url,
+                echo=settings.database_echo,
+                poolclass=AsyncAdaptedQueuePool,
+                **settings.database_config
+            )
+        return self._async_engine
+    
+    @property
+    def async_session_factory(self) -> async_sessionmaker:
+        """Get async SQLAlchemy session factory."""
+        if self._async_session_factory is None:
+            self._async_session_factory = async_sessionmaker(
+                bind=self.async_engine,
+                autoflush=False,
+                expire_on_commit=False
+            )
+        return self._async_session_factory
+    
     @property
     def neo4j_driver(self) -> Driver:
         """Get Neo4j driver (lazy initialization)."""
@@ -67,6 +95,18 @@ class DatabaseManager:
             logger.info("Connected to Redis", url=settings.redis_url)
         return self._redis_client
     
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """Get asyncio Redis client (lazy initialization)."""
+        if self._async_redis_client is None:
+            self._async_redis_client = AsyncRedis.from_url(
+                settings.redis_url,
+                password=settings.redis_password,
+                decode_responses=True
+            )
+            logger.info("Connected to async Redis", url=settings.redis_url)
+        return self._async_redis_client
+    
     def _create_engine(self) -> Engine:
         """Create SQLAlchemy engine based on environment."""
         connect_args = {}
@@ -104,6 +144,16 @@ class DatabaseManager:
         finally:
             session.close()
     
+    async def close_async_connections(self):
+        """Close the async SQLAlchemy engine and asyncio Redis client."""
+        if self._async_engine:
+            await self._async_engine.dispose()
+            logger.info("Closed async SQLAlchemy engine")
+        
+        if self._async_redis_client:
+            await self._async_redis_client.aclose()
+            logger.info("Closed async Redis client")
+    
     def close_connections(self):
         """Close all database connections."""
         if self._engine:
@@ -169,6 +219,17 @@ def get_db_session() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting a pooled async SQLAlchemy session."""
+    async with db_manager.async_session_factory() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
 def get_neo4j_session() -> Generator[Neo4jSession, None, None]:
     """Dependency for getting Neo4j session."""
     with db_manager.get_neo4j_session() as session:
@@ -177,4 +238,9 @@ def get_neo4j_session() -> Generator[Neo4jSession, None, None]:
 
 def get_redis_client() -> Redis:
     """Dependency for getting Redis client."""
-    return db_manager.redis_client
\ No newline at end of file
+    return db_manager.redis_client
+
+
+def get_async_redis_client() -> AsyncRedis:
+    """Dependency for getting asyncio Redis client."""
+    return db_manager.async_redis_client
\ No newline at end of file
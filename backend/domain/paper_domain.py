@@ -5,6 +5,7 @@ from datetime import datetime
 from dataclasses import dataclass
 
 from ..repositories.paper_repository import PaperRepository
+from ..database.models import Paper
 from ..events.base import event_bus
 from ..core.logging import LoggerMixin
 
@@ -62,8 +63,11 @@ class PaperDomainService(LoggerMixin):
     def __init__(self, paper_repository: PaperRepository):
         self.paper_repository = paper_repository
     
-    async def create_paper_with_validation(self, paper_data: Dict[str, Any]) -> PaperDomainModel:
-        """Create paper with business validation."""
+    async def create_paper_with_validation(self, paper_data: Dict[str, Any]) -> Paper:
+        """Create paper with business validation.
+        
+        Returns the persisted, refreshed row so callers need not re-fetch it.
+        """
         # Business rule: Check for duplicates
         if paper_data.get("arxiv_id"):
             existing = await self.paper_repository.find_by_arxiv_id(paper_data["arxiv_id"])
@@ -94,7 +98,7 @@ class PaperDomainService(LoggerMixin):
             )
         )
         
-        return self._to_domain_model(paper)
+        return paper
     
     async def analyze_paper_impact(self, paper_id: str) -> Dict[str, Any]:
         """Analyze paper impact using domain logic."""
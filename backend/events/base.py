@@ -72,6 +72,17 @@ class EventBus:
             tasks = [handler.handle(event) for handler in handlers]
             await asyncio.gather(*tasks, return_exceptions=True)
     
+    async def publish_many(self, events: List[Event]) -> None:
+        """Publish a batch of events, dispatching all handlers concurrently."""
+        tasks = []
+        for event in events:
+            for middleware in self._middleware:
+                event = middleware(event)
+            tasks.extend(handler.handle(event) for handler in self._handlers.get(event.event_type, []))
+        
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     def create_event(self, event_type: str, data: Dict[str, Any], 
                     source: str, correlation_id: Optional[str] = None) -> Event:
         """Create a new event."""
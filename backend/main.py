@@ -2,22 +2,27 @@
 Main FastAPI application entry point.
 Configured for POC (local) to Production (AWS) deployment.
 """
+import sys
 import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 import structlog
 
 from .core.config import settings
 from .core.logging import setup_logging, get_logger
+from .core.dependencies import close_data_pipeline_service
 from .database.connection import db_manager
 from .api.v1.router import api_router
 from .models.common_models import ErrorResponse, HealthCheck
 from .events.base import event_bus
 from .events.handlers import PaperEventHandler, AgentEventHandler, SystemEventHandler
+from .services.paper_service import flush_view_counts, stop_view_flusher
+from .services.user_service import flush_last_logins, stop_last_login_flusher
+from .services.websocket_service import websocket_manager
 
 # Setup logging
 setup_logging()
@@ -52,6 +57,12 @@ async def lifespan(app: FastAPI):
         logger.error("Database initialization failed", error=str(e))
         raise
     
+    # Relay WebSocket broadcasts across workers via Redis pub/sub
+    try:
+        await websocket_manager.start_pubsub(db_manager.async_redis_client)
+    except Exception as e:
+        logger.warning("WebSocket pub/sub unavailable, using local delivery", error=str(e))
+    
     # Store start time for uptime calculation
     app.state.start_time = time.time()
     
@@ -69,6 +80,36 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application")
     
+    # Persist any buffered paper view counts
+    try:
+        await stop_view_flusher()
+        await flush_view_counts()
+    except Exception as e:
+        logger.error("Failed to flush view counts", error=str(e))
+    
+    # Persist buffered login timestamps
+    try:
+        await stop_last_login_flusher()
+        await flush_last_logins()
+    except Exception as e:
+        logger.error("Failed to flush login timestamps", error=str(e))
+    
+    # Close pooled LLM provider connections, if any client was created
+    llm_config = sys.modules.get(f"{__package__}.core.llm_config")
+    if llm_config is not None:
+        try:
+            await llm_config.close_llm_http_client()
+        except Exception as e:
+            logger.error("Failed to close LLM HTTP client", error=str(e))
+    
+    # Close the pipeline's pooled HTTP sessions and parse workers
+    try:
+        await close_data_pipeline_service()
+    except Exception as e:
+        logger.error("Failed to close data pipeline clients", error=str(e))
+    
+    await websocket_manager.stop_pubsub()
+    
     # Publish shutdown event
     await event_bus.publish(
         event_bus.create_event(
@@ -78,6 +119,7 @@ async def lifespan(app: FastAPI):
         )
     )
     
+    await db_manager.close_async_connections()
     db_manager.close_connections()
 
 
@@ -88,6 +130,7 @@ app = FastAPI(
     description="AI Research Paper Intelligence System - Transform research papers into interactive AI agents",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
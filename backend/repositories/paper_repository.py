@@ -2,7 +2,7 @@
 
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, case, update
 from datetime import datetime, timedelta
 
 from .base import SQLAlchemyRepository
@@ -25,6 +25,16 @@ class PaperRepository(SQLAlchemyRepository[Paper]):
     async def search_by_text(self, query: str, categories: List[str] = None, 
                            limit: int = 50, offset: int = 0) -> List[Paper]:
         """Search papers by text query."""
+        db_query = self._text_search_query(query, categories)
+        return db_query.offset(offset).limit(limit).all()
+    
+    async def count_by_text(self, query: str, categories: List[str] = None) -> int:
+        """Count papers matching a text query."""
+        db_query = self._text_search_query(query, categories)
+        return db_query.with_entities(func.count(Paper.id)).scalar() or 0
+    
+    def _text_search_query(self, query: str, categories: List[str] = None):
+        """Build the filtered query shared by text search and count."""
         db_query = self.db.query(Paper).filter(
             or_(
                 Paper.title.ilike(f"%{query}%"),
@@ -35,7 +45,7 @@ class PaperRepository(SQLAlchemyRepository[Paper]):
         if categories:
             db_query = db_query.filter(Paper.categories.op("&&")(categories))
         
-        return db_query.offset(offset).limit(limit).all()
+        return db_query
     
     async def find_trending(self, categories: List[str], time_period: str, limit: int) -> List[Paper]:
         """Find trending papers."""
@@ -69,4 +79,19 @@ class PaperRepository(SQLAlchemyRepository[Paper]):
             paper.view_count += 1
             self.db.commit()
             return True
-        return False
\ No newline at end of file
+        return False
+    
+    async def bulk_increment_views(self, view_counts: Dict[str, int]) -> int:
+        """Apply buffered view increments for many papers in a single UPDATE."""
+        if not view_counts:
+            return 0
+        
+        stmt = (
+            update(Paper)
+            .where(Paper.id.in_(list(view_counts)))
+            .values(view_count=Paper.view_count + case(view_counts, value=Paper.id, else_=0))
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
@@ -8,6 +8,7 @@ import structlog
 from ..repositories.paper_repository import PaperRepository
 from ..domain.paper_domain import PaperDomain
 from ..models.paper_models import PaperCreate, PaperResponse
+from ..database.connection import db_manager
 
 # Import data pipeline components
 import sys
@@ -15,8 +16,8 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../data-pipeline'))
 
 from ingestion.arxiv_client import ArxivClient, ArxivPaper
-from processing.pdf_processor import PDFProcessor, ProcessedPaper
-from github_integration.repo_analyzer import GitHubRepoAnalyzer, RepoAnalysis
+from processing.pdf_processor import PDFProcessor, ProcessedPaper, shutdown_parse_pool
+from github_integration.repo_analyzer import GitHubRepoAnalyzer, RepoAnalysis, close_github_session
 
 logger = structlog.get_logger()
 
@@ -36,47 +37,59 @@ class DataPipelineService:
         # Initialize pipeline components
         self.arxiv_client = ArxivClient(max_results=100, delay_seconds=3.0)
         self.pdf_processor = PDFProcessor()
-        self.github_analyzer = GitHubRepoAnalyzer(github_token)
+        self.github_analyzer = GitHubRepoAnalyzer(github_token, cache=db_manager.async_redis_client)
+    
+    async def close(self):
+        """Release pooled HTTP connections and parse workers held by the pipeline clients."""
+        await close_github_session()
+        await self.arxiv_client.close()
+        await self.pdf_processor.close()
+        shutdown_parse_pool()
     
     async def fetch_and_process_papers(self, days_back: int = 7) -> Dict[str, Any]:
         """Fetch and process papers from arXiv."""
         try:
             logger.info(f"Fetching papers from last {days_back} days")
             
-            # Fetch papers from arXiv
-            arxiv_papers = await self.arxiv_client.fetch_ai_papers(days_back)
-            
             results = {
-                'total_fetched': len(arxiv_papers),
+                'total_fetched': 0,
                 'processed': 0,
                 'failed': 0,
                 'new_papers': [],
                 'errors': []
             }
             
-            for arxiv_paper in arxiv_papers:
-                try:
-                    # Check if paper already exists
-                    existing_paper = await self.paper_repository.get_by_arxiv_id(
-                        arxiv_paper.arxiv_id
-                    )
-                    
-                    if existing_paper:
-                        logger.info(f"Paper {arxiv_paper.arxiv_id} already exists, skipping")
-                        continue
-                    
-                    # Process the paper
-                    processed_paper = await self._process_arxiv_paper(arxiv_paper)
-                    
-                    if processed_paper:
-                        results['processed'] += 1
-                        results['new_papers'].append(processed_paper.id)
-                        logger.info(f"Successfully processed paper: {arxiv_paper.arxiv_id}")
-                    
-                except Exception as e:
-                    results['failed'] += 1
-                    results['errors'].append(f"{arxiv_paper.arxiv_id}: {str(e)}")
-                    logger.error(f"Failed to process paper {arxiv_paper.arxiv_id}: {e}")
+            # Stream papers from arXiv; later pages are fetched as earlier ones are processed.
+            # A page that still fails after retries ends the stream, but the papers
+            # already processed are kept and the error is reported with them
+            try:
+                async for arxiv_paper in self.arxiv_client.iter_ai_papers(days_back):
+                    results['total_fetched'] += 1
+                    try:
+                        # Check if paper already exists
+                        existing_paper = await self.paper_repository.get_by_arxiv_id(
+                            arxiv_paper.arxiv_id
+                        )
+                        
+                        if existing_paper:
+                            logger.info(f"Paper {arxiv_paper.arxiv_id} already exists, skipping")
+                            continue
+                        
+                        # Process the paper
+                        processed_paper = await self._process_arxiv_paper(arxiv_paper)
+                        
+                        if processed_paper:
+                            results['processed'] += 1
+                            results['new_papers'].append(processed_paper.id)
+                            logger.info(f"Successfully processed paper: {arxiv_paper.arxiv_id}")
+                        
+                    except Exception as e:
+                        results['failed'] += 1
+                        results['errors'].append(f"{arxiv_paper.arxiv_id}: {str(e)}")
+                        logger.error(f"Failed to process paper {arxiv_paper.arxiv_id}: {e}")
+            except Exception as e:
+                results['errors'].append(f"arXiv stream: {str(e)}")
+                logger.error(f"arXiv stream failed after {results['total_fetched']} papers: {e}")
             
             logger.info(f"Paper processing completed: {results}")
             return results
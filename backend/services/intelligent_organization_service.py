@@ -3,8 +3,9 @@ Intelligent Organization Service
 Orchestrates automatic categorization, research genealogy, and discovery
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
+import numpy as np
 from ..repositories.paper_repository import PaperRepository
 from ..core.config import get_settings
 
@@ -19,9 +20,30 @@ from genealogy.citation_analyzer import CitationAnalyzer
 from discovery.recommendation_engine import RecommendationEngine
 from discovery.trend_analyzer import TrendAnalyzer
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel then runs interpreted
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+
+@njit(cache=True)
+def _score_kernel(citations: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """Score papers by citations with a recency bonus (JIT-compiled when numba is available)"""
+    n = citations.shape[0]
+    out = np.empty(n, dtype=np.float32)
+    for i in range(n):
+        y = years[i]
+        bonus = 10.0 if y >= 2023 else (5.0 if y >= 2022 else 0.0)
+        out[i] = citations[i] * 0.7 + bonus
+    return out
+
+
 class IntelligentOrganizationService:
     """Service for intelligent paper organization and discovery"""
     
@@ -50,22 +72,30 @@ class IntelligentOrganizationService:
             logger.error(f"Error organizing papers: {e}")
             raise
     
-    async def _semantic_organization(self, papers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _semantic_organization(self, papers: List[Dict[str, Any]],
+                                     embeddings: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Organize papers using semantic clustering"""
         try:
             # Perform semantic clustering
             clustering_result = self.semantic_clusterer.cluster_papers(
-                papers, method="kmeans"
+                papers, method="kmeans", embeddings=embeddings
             )
             
+            # Build scoring arrays once for the whole corpus
+            labels = np.asarray(clustering_result["labels"])
+            citations, years = self._score_arrays(papers)
+            
             # Enhance clusters with additional metadata
             enhanced_clusters = {}
             for cluster_id, cluster_papers in clustering_result["clusters"].items():
+                mask = labels == cluster_id
                 enhanced_clusters[cluster_id] = {
                     "papers": cluster_papers,
                     "topic_info": clustering_result["topics"].get(cluster_id, {}),
                     "paper_count": len(cluster_papers),
-                    "representative_paper": self._find_representative_paper(cluster_papers),
+                    "representative_paper": self._find_representative_paper(
+                        cluster_papers, citations[mask], years[mask]
+                    ),
                     "keywords": self._extract_cluster_keywords(cluster_papers)
                 }
             
@@ -90,6 +120,7 @@ class IntelligentOrganizationService:
             topic_result = self.topic_modeler.fit_topics(papers)
             
             # Organize papers by dominant topics
+            papers_by_id = {p.get('id'): p for p in reversed(papers)}
             topic_clusters = {}
             for paper_topic in topic_result["paper_topics"]:
                 topic_id = paper_topic["dominant_topic"]
@@ -102,7 +133,7 @@ class IntelligentOrganizationService:
                     }
                 
                 # Find the original paper
-                paper = next((p for p in papers if p.get('id') == paper_topic["paper_id"]), None)
+                paper = papers_by_id.get(paper_topic["paper_id"])
                 if paper:
                     topic_clusters[topic_id]["papers"].append(paper)
                     topic_clusters[topic_id]["confidence_scores"].append(paper_topic["confidence"])
@@ -117,6 +148,7 @@ class IntelligentOrganizationService:
                 "organization_type": "topic",
                 "clusters": topic_clusters,
                 "topics": topic_result["topics"],
+                "paper_topics": topic_result["paper_topics"],
                 "summary": {
                     "total_topics": len(topic_result["topics"]),
                     "total_papers": len(papers),
@@ -131,10 +163,16 @@ class IntelligentOrganizationService:
     async def _hybrid_organization(self, papers: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Combine semantic and topic-based organization"""
         try:
-            # Get both organizations
-            semantic_org = await self._semantic_organization(papers)
+            # Get both organizations, encoding the corpus only once
+            embeddings = self.semantic_clusterer.embed(papers)
+            semantic_org = await self._semantic_organization(papers, embeddings=embeddings)
             topic_org = await self._topic_organization(papers)
             
+            # Index the single topic fit by paper id
+            dominant_topics = {}
+            for paper_topic in topic_org["paper_topics"]:
+                dominant_topics.setdefault(paper_topic["paper_id"], paper_topic["dominant_topic"])
+            
             # Create hybrid organization
             hybrid_clusters = {}
             
@@ -145,13 +183,9 @@ class IntelligentOrganizationService:
                 # Find dominant topics for papers in this cluster
                 topic_distribution = {}
                 for paper in cluster_papers:
-                    paper_id = paper.get('id')
-                    # Find topic assignment for this paper
-                    for paper_topic in topic_org.get("paper_topics", []):
-                        if paper_topic["paper_id"] == paper_id:
-                            topic_id = paper_topic["dominant_topic"]
-                            topic_distribution[topic_id] = topic_distribution.get(topic_id, 0) + 1
-                            break
+                    topic_id = dominant_topics.get(paper.get('id'))
+                    if topic_id is not None:
+                        topic_distribution[topic_id] = topic_distribution.get(topic_id, 0) + 1
                 
                 # Find dominant topic for cluster
                 dominant_topic = max(topic_distribution.items(), key=lambda x: x[1])[0] if topic_distribution else None
@@ -252,13 +286,7 @@ class IntelligentOrganizationService:
             trend_analysis = self.trend_analyzer.analyze_research_trends(papers, time_window)
             
             # Enhance with topic evolution
-            papers_by_year = {}
-            for paper in papers:
-                year = paper.get('published_year')
-                if year:
-                    if year not in papers_by_year:
-                        papers_by_year[year] = []
-                    papers_by_year[year].append(paper)
+            papers_by_year = self.trend_analyzer.group_papers_by_year(papers)
             
             topic_evolution = self.topic_modeler.get_topic_evolution(papers_by_year)
             
@@ -272,34 +300,31 @@ class IntelligentOrganizationService:
             logger.error(f"Error analyzing research trends: {e}")
             raise
     
-    def _find_representative_paper(self, papers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _find_representative_paper(self, papers: List[Dict[str, Any]],
+                                   citations: Optional[np.ndarray] = None,
+                                   years: Optional[np.ndarray] = None) -> Optional[Dict[str, Any]]:
         """Find the most representative paper in a cluster"""
         if not papers:
             return None
         
-        # Simple heuristic: paper with most citations or most recent
-        best_paper = papers[0]
-        best_score = 0
-        
-        for paper in papers:
-            score = 0
-            
-            # Citation count (if available)
-            citations = paper.get('citation_count', 0)
-            score += citations * 0.7
-            
-            # Recency bonus
-            year = paper.get('published_year', 2020)
-            if year >= 2023:
-                score += 10
-            elif year >= 2022:
-                score += 5
-            
-            if score > best_score:
-                best_score = score
-                best_paper = paper
+        if citations is None or years is None:
+            citations, years = self._score_arrays(papers)
         
-        return best_paper
+        # Simple heuristic: paper with most citations or most recent
+        scores = _score_kernel(citations, years)
+        return papers[int(np.argmax(scores))]
+    
+    def _score_arrays(self, papers: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Build citation and year arrays for the scoring kernel"""
+        citations = np.fromiter(
+            (paper.get('citation_count') or 0 for paper in papers),
+            dtype=np.float32, count=len(papers)
+        )
+        years = np.fromiter(
+            (paper.get('published_year') or 2020 for paper in papers),
+            dtype=np.int32, count=len(papers)
+        )
+        return citations, years
     
     def _extract_cluster_keywords(self, papers: List[Dict[str, Any]]) -> List[str]:
         """Extract representative keywords from cluster papers"""
@@ -1,20 +1,134 @@
 """Paper service for business logic operations."""
 
 import asyncio
+import re
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Callable
+import numpy as np
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from ..database.models import Paper
 from ..repositories.paper_repository import PaperRepository
 from ..domain.paper_domain import PaperDomainService
+from ..database.connection import db_manager
 from ..events.base import event_bus
 from ..models.paper_models import (
     PaperCreate, PaperUpdate, PaperResponse, PaperSearchRequest, 
     PaperSearchResponse, PaperAnalysisRequest, PaperAnalysisResponse
 )
-from ..core.logging import LoggerMixin
+from ..core.logging import LoggerMixin, get_logger
 from ..core.config import settings
 
+logger = get_logger(__name__)
+
+# Single-pass, case-insensitive title scan for methodology keywords
+_METHODOLOGY_RE = re.compile(r"(?P<transformer>transformer|attention)|(?P<deep>deep)", re.IGNORECASE)
+
+# Buffered view counts, flushed to the database in one UPDATE per interval
+VIEW_FLUSH_INTERVAL_SECONDS = 5.0
+_view_counter: Dict[str, int] = defaultdict(int)
+_view_counter_lock = asyncio.Lock()
+_view_flush_task: Optional[asyncio.Task] = None
+
+
+# Response fields that are not copied verbatim from a Paper attribute
+_RESPONSE_FIELD_OVERRIDES = {
+    "agent_available": "len(paper.agents) > 0",
+    "implementation_guide_available": "paper.has_code",
+}
+
+
+def _build_response_converter() -> Callable[[Paper], PaperResponse]:
+    """Generate a Paper -> PaperResponse converter specialized to the model fields.
+    
+    The generated function reads each field straight off the ORM row and
+    calls model_construct, skipping per-field validation on hot read paths.
+    """
+    assignments = ",\n        ".join(
+        f"{name}={_RESPONSE_FIELD_OVERRIDES.get(name, f'paper.{name}')}"
+        for name in PaperResponse.model_fields
+    )
+    source = (
+        "def _fast_to_response(paper):\n"
+        "    return PaperResponse.model_construct(\n"
+        f"        {assignments}\n"
+        "    )\n"
+    )
+    namespace = {"PaperResponse": PaperResponse}
+    exec(compile(source, "<paper_response_converter>", "exec"), namespace)
+    return namespace["_fast_to_response"]
+
+
+_fast_to_response = _build_response_converter()
+
+
+async def flush_view_counts() -> None:
+    """Write buffered view counts and publish the matching view events."""
+    global _view_counter
+    async with _view_counter_lock:
+        pending, _view_counter = _view_counter, defaultdict(int)
+    
+    if not pending:
+        return
+    
+    session = db_manager.get_session()
+    try:
+        await PaperRepository(session).bulk_increment_views(pending)
+    except BaseException:
+        # Put the views back so the next flush retries them instead of dropping them
+        async with _view_counter_lock:
+            for paper_id, views in pending.items():
+                _view_counter[paper_id] += views
+        raise
+    finally:
+        session.close()
+    
+    await event_bus.publish_many([
+        event_bus.create_event(
+            "paper.viewed",
+            {"paper_id": paper_id, "views": views},
+            "paper_service"
+        )
+        for paper_id, views in pending.items()
+    ])
+
+
+async def _view_flush_loop() -> None:
+    """Periodically flush buffered view counts."""
+    while True:
+        await asyncio.sleep(VIEW_FLUSH_INTERVAL_SECONDS)
+        try:
+            await flush_view_counts()
+        except Exception as e:
+            logger.error("view_count_flush_failed", error=str(e))
+
+
+def _ensure_view_flusher() -> None:
+    """Start the view flush loop on the running event loop if needed."""
+    global _view_flush_task
+    if _view_flush_task is not None and not _view_flush_task.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _view_flush_task = loop.create_task(_view_flush_loop())
+
+
+async def stop_view_flusher() -> None:
+    """Cancel the periodic flush loop (call before the final flush on shutdown)."""
+    global _view_flush_task
+    task, _view_flush_task = _view_flush_task, None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
 
 class PaperService(LoggerMixin):
     """Service for paper management operations."""
@@ -23,17 +137,15 @@ class PaperService(LoggerMixin):
         self.db = db
         self.paper_repository = PaperRepository(db)
         self.domain_service = PaperDomainService(self.paper_repository)
+        _ensure_view_flusher()
     
     async def create_paper(self, paper_data: PaperCreate) -> PaperResponse:
         """Create a new paper using domain service."""
         try:
-            # Use domain service for business logic
-            domain_paper = await self.domain_service.create_paper_with_validation(
+            # Use domain service for business logic; it returns the refreshed row
+            paper = await self.domain_service.create_paper_with_validation(
                 paper_data.dict()
             )
-            
-            # Get full paper from repository
-            paper = await self.paper_repository.get_by_id(domain_paper.id)
             return self._to_response(paper)
             
         except Exception as e:
@@ -46,33 +158,32 @@ class PaperService(LoggerMixin):
         if not paper:
             return None
         
-        # Increment view count and publish event
-        await self.paper_repository.increment_view_count(paper_id)
-        await event_bus.publish(
-            event_bus.create_event(
-                "paper.viewed",
-                {"paper_id": paper_id},
-                "paper_service"
-            )
-        )
+        # Buffer the view; the flush loop writes it and publishes the event
+        async with _view_counter_lock:
+            _view_counter[paper_id] += 1
         
         return self._to_response(paper)
     
     async def update_paper(self, paper_id: str, paper_update: PaperUpdate) -> Optional[PaperResponse]:
-        """Update existing paper."""
-        paper = self.db.query(Paper).filter(Paper.id == paper_id).first()
-        if not paper:
-            return None
-        
-        # Update fields
+        """Update existing paper with a single UPDATE ... RETURNING."""
         update_data = paper_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(paper, field, value)
+        if not update_data:
+            paper = await self.paper_repository.get_by_id(paper_id)
+            return self._to_response(paper) if paper else None
+        
+        stmt = (
+            update(Paper)
+            .where(Paper.id == paper_id)
+            .values(**update_data)
+            .returning(Paper)
+        )
+        paper = self.db.execute(stmt).scalar_one_or_none()
         
+        # Build the response before commit expires the returned row
+        response = self._to_response(paper) if paper else None
         self.db.commit()
-        self.db.refresh(paper)
         
-        return self._to_response(paper)
+        return response
     
     async def delete_paper(self, paper_id: str) -> bool:
         """Delete paper."""
@@ -86,22 +197,28 @@ class PaperService(LoggerMixin):
     
     async def search_papers(self, search_request: PaperSearchRequest) -> PaperSearchResponse:
         """Search papers using repository."""
-        # Use repository for search
+        query = search_request.query or ""
+        
         papers = await self.paper_repository.search_by_text(
-            query=search_request.query or "",
+            query=query,
             categories=search_request.categories,
             limit=search_request.limit,
             offset=search_request.offset
         )
+        # True match count, not just the size of this page
+        total = await self.paper_repository.count_by_text(
+            query=query,
+            categories=search_request.categories
+        )
         
         # For now, return simplified response (can be enhanced with more filters)
         return PaperSearchResponse(
-            papers=[self._to_response(paper) for paper in papers],
-            total_count=len(papers),
+            papers=list(map(self._to_response, papers)),
+            total_count=total,
             page_info={
                 "limit": search_request.limit,
                 "offset": search_request.offset,
-                "total": len(papers)
+                "total": total
             }
         )
     
@@ -174,35 +291,8 @@ class PaperService(LoggerMixin):
             self.db.commit()
             self.log_error(e, operation="process_paper", paper_id=paper_id)
     
-    def _to_response(self, paper: Paper) -> PaperResponse:
-        """Convert Paper model to response."""
-        return PaperResponse(
-            id=paper.id,
-            title=paper.title,
-            abstract=paper.abstract,
-            authors=paper.authors,
-            categories=paper.categories,
-            arxiv_id=paper.arxiv_id,
-            doi=paper.doi,
-            published_date=paper.published_date,
-            updated_date=paper.updated_date,
-            journal=paper.journal,
-            pdf_url=paper.pdf_url,
-            citation_count=paper.citation_count,
-            view_count=paper.view_count,
-            download_count=paper.download_count,
-            summary=paper.summary,
-            keywords=paper.keywords,
-            methodology=paper.methodology,
-            github_repos=paper.github_repos,
-            has_code=paper.has_code,
-            processing_status=paper.processing_status,
-            embedding_status=paper.embedding_status,
-            agent_available=len(paper.agents) > 0,
-            implementation_guide_available=paper.has_code,
-            created_at=paper.created_at,
-            updated_at=paper.updated_at
-        )
+    # Generated at import time; see _build_response_converter
+    _to_response = staticmethod(_fast_to_response)
     
     async def _analyze_methodology(self, paper: Paper) -> Dict[str, Any]:
         """Analyze paper methodology."""
@@ -225,11 +315,34 @@ class PaperService(LoggerMixin):
     
     async def _analyze_impact(self, paper: Paper) -> Dict[str, Any]:
         """Analyze paper impact."""
-        return {
-            "citation_velocity": paper.citation_count / max((datetime.utcnow() - paper.published_date).days, 1),
-            "influence_score": min(paper.citation_count / 100, 1.0),
-            "novelty_score": 0.8
-        }
+        return (await self.analyze_impact_batch([paper]))[0]
+    
+    async def analyze_impact_batch(self, papers: List[Paper]) -> List[Dict[str, Any]]:
+        """Analyze impact for many papers with vectorized arithmetic."""
+        if not papers:
+            return []
+        
+        now = np.datetime64(datetime.utcnow(), "s")
+        dates = np.array(
+            [p.published_date or now for p in papers], dtype="datetime64[s]"
+        )
+        days = np.maximum(
+            np.floor((now - dates) / np.timedelta64(1, "D")).astype(np.float64), 1.0
+        )
+        citations = np.fromiter(
+            (p.citation_count or 0 for p in papers), dtype=np.float64, count=len(papers)
+        )
+        velocity = citations / days
+        influence = np.minimum(citations / 100.0, 1.0)
+        
+        return [
+            {
+                "citation_velocity": float(v),
+                "influence_score": float(i),
+                "novelty_score": 0.8
+            }
+            for v, i in zip(velocity, influence)
+        ]
     
     async def _analyze_github_repos(self, repos: List[str]) -> Dict[str, Any]:
         """Analyze GitHub repositories."""
@@ -253,9 +366,10 @@ class PaperService(LoggerMixin):
     async def _extract_methodology(self, paper: Paper) -> List[str]:
         """Extract methodology from paper."""
         # Placeholder for methodology extraction
+        found = {match.lastgroup for match in _METHODOLOGY_RE.finditer(paper.title)}
         methodologies = []
-        if "transformer" in paper.title.lower() or "attention" in paper.title.lower():
+        if "transformer" in found:
             methodologies.append("transformer_architecture")
-        if "deep" in paper.title.lower():
+        if "deep" in found:
             methodologies.append("deep_learning")
-        return methodologies or ["machine_learning"]
\ No newline at end of file
+        return methodologies or ["machine_learning"]
@@ -1,43 +1,150 @@
 """User service for authentication and user management."""
 
+import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, exists, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from redis.asyncio import Redis
 
-from ..database.models import User
+from ..database.connection import db_manager
+from ..database.models import AgentConversation, User
 from ..models.user_models import (
     UserCreate, UserUpdate, UserResponse, UserLogin, Token, 
     UserDashboard, UserPreferences, UserStats
 )
 from ..core.security import security_manager, get_password_hash, verify_password
-from ..core.logging import LoggerMixin
+from ..core.logging import LoggerMixin, get_logger
 from ..core.config import settings
 
+logger = get_logger(__name__)
+
+# How long serialized user profiles stay in Redis
+USER_CACHE_TTL_SECONDS = 300
+
+# Access token lifetime reported to clients
+_TOKEN_EXPIRES = settings.access_token_expire_minutes * 60
+
+# Login timestamps are buffered in a Redis hash (user_id -> ISO time) and
+# written to the database in one batched UPDATE per interval
+LAST_LOGIN_KEY = "user:last_login"
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = 60.0
+_last_login_flush_task: Optional[asyncio.Task] = None
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash used to equalize login timing when there is no real hash to check."""
+    return get_password_hash("x" * 16)
+
+
+def _verify_dummy_password(password: str) -> bool:
+    """Run a full bcrypt verify against the dummy hash."""
+    return verify_password(password, _dummy_password_hash())
+
+
+async def flush_last_logins(redis: Optional[Redis] = None) -> None:
+    """Write buffered login timestamps to the users table."""
+    redis = redis if redis is not None else db_manager.async_redis_client
+    # Read and clear atomically so logins recorded meanwhile are kept for the next flush
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hgetall(LAST_LOGIN_KEY)
+        pipe.delete(LAST_LOGIN_KEY)
+        pending, _ = await pipe.execute()
+    
+    if not pending:
+        return
+    
+    try:
+        async with db_manager.async_session_factory() as session:
+            # Users deleted since logging in have no row to update; skip them
+            existing = set(await session.scalars(
+                select(User.id).where(User.id.in_(list(pending)))
+            ))
+            if existing:
+                await session.execute(
+                    update(User),
+                    [
+                        {"id": user_id, "last_login": datetime.fromisoformat(timestamp)}
+                        for user_id, timestamp in pending.items()
+                        if user_id in existing
+                    ]
+                )
+                await session.commit()
+    except BaseException:
+        # Re-queue for the next flush; HSETNX keeps any newer login recorded meanwhile
+        async with redis.pipeline(transaction=False) as pipe:
+            for user_id, timestamp in pending.items():
+                pipe.hsetnx(LAST_LOGIN_KEY, user_id, timestamp)
+            await pipe.execute()
+        raise
+
+
+async def _last_login_flush_loop() -> None:
+    """Periodically flush buffered login timestamps."""
+    while True:
+        await asyncio.sleep(LAST_LOGIN_FLUSH_INTERVAL_SECONDS)
+        try:
+            await flush_last_logins()
+        except Exception as e:
+            logger.error("last_login_flush_failed", error=str(e))
+
+
+def _ensure_last_login_flusher() -> None:
+    """Start the last-login flush loop on the running event loop if needed."""
+    global _last_login_flush_task
+    if _last_login_flush_task is not None and not _last_login_flush_task.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _last_login_flush_task = loop.create_task(_last_login_flush_loop())
+
+
+async def stop_last_login_flusher() -> None:
+    """Cancel the periodic flush loop (call before the final flush on shutdown)."""
+    global _last_login_flush_task
+    task, _last_login_flush_task = _last_login_flush_task, None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
 
 class UserService(LoggerMixin):
     """Service for user management and authentication."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, redis: Optional[Redis] = None):
         self.db = db
+        self.redis = redis if redis is not None else db_manager.async_redis_client
+        _ensure_last_login_flusher()
     
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         """Create a new user."""
         try:
-            # Check if user already exists
-            existing = self.db.query(User).filter(
-                (User.username == user_data.username) | 
-                (User.email == user_data.email)
-            ).first()
+            # Check if user already exists (boolean EXISTS, no row fetch)
+            taken = await self.db.scalar(
+                select(exists().where(or_(
+                    User.username == user_data.username,
+                    User.email == user_data.email
+                )))
+            )
             
-            if existing:
+            if taken:
                 raise ValueError("User with this username or email already exists")
             
-            # Create user
+            # Create user; bcrypt runs in a worker thread to keep the loop free
+            hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
             user = User(
                 username=user_data.username,
                 email=user_data.email,
-                hashed_password=get_password_hash(user_data.password),
+                hashed_password=hashed_password,
                 full_name=user_data.full_name,
                 affiliation=user_data.affiliation,
                 research_interests=user_data.research_interests or [],
@@ -46,14 +153,18 @@ class UserService(LoggerMixin):
             )
             
             self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            try:
+                await self.db.commit()
+            except IntegrityError:
+                # Lost a race with a concurrent signup; the unique indexes caught it
+                raise ValueError("User with this username or email already exists")
+            await self.db.refresh(user)
             
             self.log_event("user_created", user_id=user.id, username=user.username)
             return self._to_response(user)
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             self.log_error(e, operation="create_user")
             raise
     
@@ -61,21 +172,33 @@ class UserService(LoggerMixin):
         """Authenticate user and return token."""
         try:
             # Find user by username or email
-            user = self.db.query(User).filter(
-                (User.username == login_data.username) | 
-                (User.email == login_data.username)
-            ).first()
+            result = await self.db.execute(
+                select(User).where(
+                    (User.username == login_data.username) | 
+                    (User.email == login_data.username)
+                )
+            )
+            user = result.scalars().first()
             
             if not user or not user.is_active:
+                # Spend the same bcrypt time as a real check so missing users
+                # can't be told apart from wrong passwords by response time
+                await asyncio.to_thread(_verify_dummy_password, login_data.password)
                 return None
             
             # Verify password
-            if not verify_password(login_data.password, user.hashed_password):
+            try:
+                password_ok = await asyncio.to_thread(
+                    verify_password, login_data.password, user.hashed_password
+                )
+            except ValueError:
+                # Unparseable stored hash: equalize timing, then reject
+                await asyncio.to_thread(_verify_dummy_password, login_data.password)
+                password_ok = False
+            if not password_ok:
                 return None
             
-            # Update last login
-            user.last_login = datetime.utcnow()
-            self.db.commit()
+            await self._record_login(user)
             
             # Create token
             user_data = {
@@ -89,10 +212,11 @@ class UserService(LoggerMixin):
             
             self.log_event("user_authenticated", user_id=user.id, username=user.username)
             
-            return Token(
+            # Fields are already well-typed; skip validation
+            return Token.model_construct(
                 access_token=access_token,
                 token_type="bearer",
-                expires_in=settings.access_token_expire_minutes * 60,
+                expires_in=_TOKEN_EXPIRES,
                 user_id=user.id,
                 username=user.username
             )
@@ -103,73 +227,126 @@ class UserService(LoggerMixin):
     
     async def get_user(self, user_id: str) -> Optional[UserResponse]:
         """Get user by ID."""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return None
-        return self._to_response(user)
+        cached = await self._cache_get(f"user:{user_id}")
+        if cached:
+            response = UserResponse.model_validate_json(cached)
+        else:
+            user = await self._get_user_orm(user_id)
+            if not user:
+                return None
+            response = await self._cache_response(user)
+        return await self._with_pending_login(response)
+    
+    async def get_user_json(self, user_id: str) -> Optional[str]:
+        """Get the serialized user profile, skipping model construction on a cache hit.
+        
+        Routes can return this directly as a JSON response body.
+        """
+        cached = await self._cache_get(f"user:{user_id}")
+        if not cached:
+            user = await self._get_user_orm(user_id)
+            if not user:
+                return None
+            cached = (await self._cache_response(user)).model_dump_json()
+        
+        last_login = await self._pending_last_login(user_id)
+        if last_login is None:
+            return cached
+        response = UserResponse.model_validate_json(cached)
+        response.last_login = last_login
+        return response.model_dump_json()
     
     async def get_user_by_username(self, username: str) -> Optional[UserResponse]:
         """Get user by username."""
-        user = self.db.query(User).filter(User.username == username).first()
+        user_id = await self._cache_get(f"username:{username}")
+        if user_id:
+            return await self.get_user(user_id)
+        
+        result = await self.db.execute(select(User).where(User.username == username))
+        user = result.scalar_one_or_none()
         if not user:
             return None
-        return self._to_response(user)
+        return await self._with_pending_login(await self._cache_response(user))
     
     async def update_user(self, user_id: str, user_update: UserUpdate) -> Optional[UserResponse]:
         """Update user information."""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return None
-        
         update_data = user_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        if not update_data:
+            return await self.get_user(user_id)
         
-        self.db.commit()
-        self.db.refresh(user)
+        # Single UPDATE ... RETURNING instead of SELECT + setattr + COMMIT + REFRESH
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+        user = result.scalar_one_or_none()
+        if not user:
+            return None
+        await self.db.commit()
+        await self._invalidate_user_cache(user)
         
         self.log_event("user_updated", user_id=user_id)
         return self._to_response(user)
     
     async def delete_user(self, user_id: str) -> bool:
         """Delete user (soft delete by deactivating)."""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = await self._get_user_orm(user_id)
         if not user:
             return False
         
         user.is_active = False
-        self.db.commit()
+        await self.db.commit()
+        await self._invalidate_user_cache(user)
         
         self.log_event("user_deleted", user_id=user_id)
         return True
     
     async def get_user_dashboard(self, user_id: str) -> Optional[UserDashboard]:
         """Get personalized dashboard data for user."""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = await self._get_user_orm(user_id)
         if not user:
             return None
         
         # Get user's research interests
         interests = user.research_interests or []
         
-        # Placeholder dashboard data (would be populated from actual services)
+        # Placeholder dashboard data (would be populated from actual services);
+        # the sections are independent, so fetch them concurrently. Only the
+        # conversations section queries the session (AsyncSession allows one
+        # operation at a time)
+        (
+            papers, agents, conversations, progress,
+            trending, tutorials, recommended, usage
+        ) = await asyncio.gather(
+            self._get_personalized_papers(user),
+            self._get_user_agents(user_id),
+            self._get_recent_conversations(user_id),
+            self._get_research_progress(user),
+            self._get_trending_papers(interests),
+            self._get_user_tutorials(user_id),
+            self._get_recommended_papers(user),
+            self._get_usage_stats(user_id)
+        )
+        
         dashboard_data = {
             "user_id": user_id,
-            "personalized_papers": await self._get_personalized_papers(user),
-            "active_agents": await self._get_user_agents(user_id),
-            "recent_conversations": await self._get_recent_conversations(user_id),
-            "research_progress": await self._get_research_progress(user),
-            "trending_in_interests": await self._get_trending_papers(interests),
-            "implementation_tutorials": await self._get_user_tutorials(user_id),
-            "recommended_papers": await self._get_recommended_papers(user),
-            "usage_stats": await self._get_usage_stats(user_id)
+            "personalized_papers": papers,
+            "active_agents": agents,
+            "recent_conversations": conversations,
+            "research_progress": progress,
+            "trending_in_interests": trending,
+            "implementation_tutorials": tutorials,
+            "recommended_papers": recommended,
+            "usage_stats": usage
         }
         
         return UserDashboard(**dashboard_data)
     
     async def get_user_preferences(self, user_id: str) -> Optional[UserPreferences]:
         """Get user preferences."""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = await self._get_user_orm(user_id)
         if not user:
             return None
         
@@ -183,23 +360,29 @@ class UserService(LoggerMixin):
     
     async def update_user_preferences(self, user_id: str, preferences: UserPreferences) -> bool:
         """Update user preferences."""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                research_interests=preferences.research_interests,
+                preferred_frameworks=preferences.preferred_frameworks,
+                experience_level=preferences.experience_level,
+                notification_preferences=preferences.notification_preferences
+            )
+            .returning(User)
+        )
+        user = result.scalar_one_or_none()
         if not user:
             return False
-        
-        user.research_interests = preferences.research_interests
-        user.preferred_frameworks = preferences.preferred_frameworks
-        user.experience_level = preferences.experience_level
-        user.notification_preferences = preferences.notification_preferences
-        
-        self.db.commit()
+        await self.db.commit()
+        await self._invalidate_user_cache(user)
         
         self.log_event("user_preferences_updated", user_id=user_id)
         return True
     
     async def get_user_stats(self, user_id: str) -> Optional[UserStats]:
         """Get user statistics."""
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = await self._get_user_orm(user_id)
         if not user:
             return None
         
@@ -225,17 +408,78 @@ class UserService(LoggerMixin):
     
     async def increment_user_query_count(self, user_id: str):
         """Increment user's query count."""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if user:
-            user.total_queries += 1
-            self.db.commit()
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(total_queries=User.total_queries + 1)
+        )
+        await self.db.commit()
     
     async def increment_user_agent_count(self, user_id: str):
         """Increment user's agent creation count."""
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if user:
-            user.total_agents_created += 1
-            self.db.commit()
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(total_agents_created=User.total_agents_created + 1)
+        )
+        await self.db.commit()
+    
+    async def _get_user_orm(self, user_id: str) -> Optional[User]:
+        """Fetch a User row; the session's identity map skips repeat selects."""
+        return await self.db.get(User, user_id)
+    
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Read a user cache entry, treating Redis errors as a miss."""
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            self.log_error(e, operation="user_cache_get", key=key)
+            return None
+    
+    async def _cache_response(self, user: User) -> UserResponse:
+        """Build the user response and cache it by id and username."""
+        response = self._to_response(user)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(f"user:{user.id}", USER_CACHE_TTL_SECONDS, response.model_dump_json())
+                pipe.setex(f"username:{user.username}", USER_CACHE_TTL_SECONDS, user.id)
+                await pipe.execute()
+        except Exception as e:
+            self.log_error(e, operation="user_cache_set", user_id=user.id)
+        return response
+    
+    async def _record_login(self, user: User) -> None:
+        """Buffer the login time in Redis; falls back to a direct write if Redis is down."""
+        now = datetime.utcnow()
+        try:
+            await self.redis.hset(LAST_LOGIN_KEY, user.id, now.isoformat())
+        except Exception as e:
+            self.log_error(e, operation="record_login", user_id=user.id)
+            user.last_login = now
+            await self.db.commit()
+    
+    async def _pending_last_login(self, user_id: str) -> Optional[datetime]:
+        """Login time recorded since the last flush, if any."""
+        try:
+            timestamp = await self.redis.hget(LAST_LOGIN_KEY, user_id)
+        except Exception as e:
+            self.log_error(e, operation="pending_last_login", user_id=user_id)
+            return None
+        return datetime.fromisoformat(timestamp) if timestamp else None
+    
+    async def _with_pending_login(self, response: UserResponse) -> UserResponse:
+        """Overlay a not-yet-flushed login time onto a user response."""
+        last_login = await self._pending_last_login(response.id)
+        if last_login is not None:
+            response.last_login = last_login
+        return response
+    
+    async def _invalidate_user_cache(self, user: User) -> None:
+        """Drop cached profile entries after a user write."""
+        try:
+            await self.redis.delete(f"user:{user.id}", f"username:{user.username}")
+        except Exception as e:
+            self.log_error(e, operation="user_cache_invalidate", user_id=user.id)
     
     def _to_response(self, user: User) -> UserResponse:
         """Convert User model to response."""
@@ -281,16 +525,22 @@ class UserService(LoggerMixin):
             }
         ]
     
-    async def _get_recent_conversations(self, user_id: str) -> list:
-        """Get user's recent conversations."""
-        # Placeholder - would query conversation data
+    async def _get_recent_conversations(self, user_id: str, limit: int = 5) -> list:
+        """Get user's most recent conversation messages (served by idx_conversations_user)."""
+        result = await self.db.execute(
+            select(AgentConversation)
+            .where(AgentConversation.user_id == user_id)
+            .order_by(AgentConversation.created_at.desc())
+            .limit(limit)
+        )
         return [
             {
-                "session_id": "session_1",
-                "agent_id": "agent_1",
-                "last_message": "Can you explain the attention mechanism?",
-                "timestamp": datetime.utcnow().isoformat()
+                "session_id": conversation.session_id,
+                "agent_id": conversation.agent_id,
+                "last_message": conversation.content,
+                "timestamp": conversation.created_at.isoformat()
             }
+            for conversation in result.scalars()
         ]
     
     async def _get_research_progress(self, user: User) -> dict:
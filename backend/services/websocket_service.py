@@ -1,10 +1,33 @@
 """WebSocket service for real-time communication."""
 
-import json
-from typing import Dict, List, Optional
+import asyncio
+import orjson
+from typing import Dict, List, Optional, Tuple
 from fastapi import WebSocket
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
 from ..core.logging import LoggerMixin
 
+# Upper bound on a single send so one slow client can't stall a broadcast
+SEND_TIMEOUT_SECONDS = 5.0
+
+# Redis pub/sub channels shared by every worker
+BROADCAST_CHANNEL = "ws:broadcast"
+ROOM_CHANNEL_PREFIX = "ws:room:"
+
+# Backoff between attempts to re-subscribe after the pub/sub connection drops
+PUBSUB_RECONNECT_INITIAL_SECONDS = 1.0
+PUBSUB_RECONNECT_MAX_SECONDS = 30.0
+
+
+def encode_json(data) -> str:
+    """Serialize a payload for a WebSocket text frame.
+    
+    Naive datetimes are treated as UTC and non-string dict keys are
+    stringified, as ``json.dumps`` did.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS).decode()
+
 
 class WebSocketManager(LoggerMixin):
     """Manages WebSocket connections for real-time communication."""
@@ -16,33 +39,136 @@ class WebSocketManager(LoggerMixin):
         self.connection_metadata: Dict[str, Dict] = {}
         # Store room memberships: room_id -> set of connection_ids
         self.rooms: Dict[str, set] = {}
+        # Reverse indexes: websocket -> connection_id, connection_id -> room_ids
+        self.ws_to_id: Dict[WebSocket, str] = {}
+        self.connection_rooms: Dict[str, set] = {}
+        # Store user connections: user_id -> set of connection_ids
+        self.user_connections: Dict[str, set] = {}
+        # Cross-worker fan-out over Redis pub/sub (local-only until started)
+        self.redis: Optional[Redis] = None
+        self._pubsub: Optional[PubSub] = None
+        self._listener_task: Optional[asyncio.Task] = None
+    
+    async def start_pubsub(self, redis: Redis):
+        """Relay broadcasts and room messages through Redis so every worker delivers them."""
+        if self._listener_task is not None:
+            return
+        
+        pubsub = await self._subscribe(redis)
+        
+        self.redis = redis
+        self._pubsub = pubsub
+        self._listener_task = asyncio.create_task(self._supervise())
+        
+        self.log_event("websocket_pubsub_started")
+    
+    async def stop_pubsub(self):
+        """Stop relaying through Redis and fall back to local delivery."""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        
+        if self._pubsub is not None:
+            await self._close_pubsub(self._pubsub)
+            self._pubsub = None
+        self.redis = None
+    
+    async def _subscribe(self, redis: Redis) -> PubSub:
+        """Open a pub/sub connection subscribed to the broadcast and room channels."""
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(BROADCAST_CHANNEL)
+            await pubsub.psubscribe(f"{ROOM_CHANNEL_PREFIX}*")
+        except BaseException:
+            await self._close_pubsub(pubsub)
+            raise
+        return pubsub
+    
+    async def _close_pubsub(self, pubsub: PubSub):
+        """Close a pub/sub connection, ignoring errors from an already broken one."""
+        try:
+            await pubsub.aclose()
+        except Exception as e:
+            self.log_error(e, operation="websocket_pubsub_close")
+    
+    async def _supervise(self):
+        """Keep the listener running, re-subscribing with backoff whenever it dies.
+        
+        While the connection is down ``_pubsub`` is None, so publishers deliver
+        to this worker's connections directly instead of losing the message.
+        """
+        delay = PUBSUB_RECONNECT_INITIAL_SECONDS
+        while True:
+            if self._pubsub is not None:
+                try:
+                    await self._listen(self._pubsub)
+                    self.log_event("websocket_pubsub_listener_stopped")
+                except Exception as e:
+                    self.log_error(e, operation="websocket_pubsub_listen")
+                pubsub, self._pubsub = self._pubsub, None
+                await self._close_pubsub(pubsub)
+            
+            await asyncio.sleep(delay)
+            try:
+                self._pubsub = await self._subscribe(self.redis)
+            except Exception as e:
+                self.log_error(e, operation="websocket_pubsub_reconnect", retry_in=delay)
+                delay = min(delay * 2, PUBSUB_RECONNECT_MAX_SECONDS)
+                continue
+            delay = PUBSUB_RECONNECT_INITIAL_SECONDS
+            self.log_event("websocket_pubsub_reconnected")
+    
+    async def _listen(self, pubsub: PubSub):
+        """Deliver messages published by any worker to local connections."""
+        async for message in pubsub.listen():
+            try:
+                channel = message["channel"]
+                payload = message["data"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                if isinstance(payload, bytes):
+                    payload = payload.decode()
+                
+                if channel == BROADCAST_CHANNEL:
+                    await self._fan_out(list(self.active_connections.items()), payload, "broadcast")
+                elif channel.startswith(ROOM_CHANNEL_PREFIX):
+                    room_id = channel[len(ROOM_CHANNEL_PREFIX):]
+                    await self._fan_out(self._room_targets(room_id), payload, "send_to_room", room_id=room_id)
+            except Exception as e:
+                self.log_error(e, operation="websocket_pubsub_listen")
     
     async def connect(self, websocket: WebSocket, connection_id: str, metadata: Optional[Dict] = None):
         """Accept a new WebSocket connection."""
         await websocket.accept()
+        previous = self.active_connections.get(connection_id)
+        if previous is not None:
+            self.ws_to_id.pop(previous, None)
+            self._unindex_user(connection_id)
+        
         self.active_connections[connection_id] = websocket
         self.connection_metadata[connection_id] = metadata or {}
+        self.ws_to_id[websocket] = connection_id
+        self.connection_rooms.setdefault(connection_id, set())
+        if metadata and "user_id" in metadata:
+            self.user_connections.setdefault(metadata["user_id"], set()).add(connection_id)
         
         self.log_event("websocket_connected", connection_id=connection_id, metadata=metadata)
     
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        # Find connection_id by websocket
-        connection_id = None
-        for conn_id, ws in self.active_connections.items():
-            if ws == websocket:
-                connection_id = conn_id
-                break
+        connection_id = self.ws_to_id.pop(websocket, None)
         
         if connection_id:
-            # Remove from all rooms
-            for room_id, members in self.rooms.items():
-                members.discard(connection_id)
-            
-            # Clean up empty rooms
-            self.rooms = {room_id: members for room_id, members in self.rooms.items() if members}
+            # Remove from the rooms this connection joined, dropping empty ones
+            for room_id in self.connection_rooms.pop(connection_id, ()):
+                self._discard_member(room_id, connection_id)
             
             # Remove connection
+            self._unindex_user(connection_id)
             del self.active_connections[connection_id]
             del self.connection_metadata[connection_id]
             
@@ -64,38 +190,24 @@ class WebSocketManager(LoggerMixin):
         if connection_id in self.active_connections:
             websocket = self.active_connections[connection_id]
             try:
-                await websocket.send_json(data)
+                await websocket.send_text(encode_json(data))
             except Exception as e:
                 self.log_error(e, operation="send_json_message", connection_id=connection_id)
                 self.disconnect(websocket)
     
     async def broadcast_message(self, message: str):
         """Broadcast a message to all connected clients."""
-        disconnected = []
-        for connection_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                self.log_error(e, operation="broadcast_message", connection_id=connection_id)
-                disconnected.append(websocket)
-        
-        # Clean up disconnected clients
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        if await self._publish(BROADCAST_CHANNEL, message):
+            return
+        await self._fan_out(list(self.active_connections.items()), message, "broadcast_message")
     
     async def broadcast_json(self, data: dict):
         """Broadcast a JSON message to all connected clients."""
-        disconnected = []
-        for connection_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_json(data)
-            except Exception as e:
-                self.log_error(e, operation="broadcast_json", connection_id=connection_id)
-                disconnected.append(websocket)
-        
-        # Clean up disconnected clients
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        # Serialize once and reuse the text frame for every client
+        payload = encode_json(data)
+        if await self._publish(BROADCAST_CHANNEL, payload):
+            return
+        await self._fan_out(list(self.active_connections.items()), payload, "broadcast_json")
     
     def join_room(self, connection_id: str, room_id: str):
         """Add a connection to a room."""
@@ -103,55 +215,96 @@ class WebSocketManager(LoggerMixin):
             if room_id not in self.rooms:
                 self.rooms[room_id] = set()
             self.rooms[room_id].add(connection_id)
+            self.connection_rooms.setdefault(connection_id, set()).add(room_id)
             
             self.log_event("websocket_joined_room", connection_id=connection_id, room_id=room_id)
     
     def leave_room(self, connection_id: str, room_id: str):
         """Remove a connection from a room."""
         if room_id in self.rooms:
-            self.rooms[room_id].discard(connection_id)
-            if not self.rooms[room_id]:
-                del self.rooms[room_id]
+            self._discard_member(room_id, connection_id)
+            self.connection_rooms.get(connection_id, set()).discard(room_id)
             
             self.log_event("websocket_left_room", connection_id=connection_id, room_id=room_id)
     
+    def _discard_member(self, room_id: str, connection_id: str):
+        """Drop a connection from a room, deleting the room once it is empty."""
+        members = self.rooms.get(room_id)
+        if members is None:
+            return
+        members.discard(connection_id)
+        if not members:
+            del self.rooms[room_id]
+    
     async def send_to_room(self, message: str, room_id: str):
         """Send a message to all connections in a room."""
+        if await self._publish(f"{ROOM_CHANNEL_PREFIX}{room_id}", message):
+            return
         if room_id not in self.rooms:
             return
         
-        disconnected = []
-        for connection_id in self.rooms[room_id].copy():
-            if connection_id in self.active_connections:
-                websocket = self.active_connections[connection_id]
-                try:
-                    await websocket.send_text(message)
-                except Exception as e:
-                    self.log_error(e, operation="send_to_room", connection_id=connection_id, room_id=room_id)
-                    disconnected.append(websocket)
-        
-        # Clean up disconnected clients
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        await self._fan_out(self._room_targets(room_id), message, "send_to_room", room_id=room_id)
     
     async def send_json_to_room(self, data: dict, room_id: str):
         """Send a JSON message to all connections in a room."""
-        if room_id not in self.rooms:
+        if self._pubsub is None and room_id not in self.rooms:
             return
         
-        disconnected = []
-        for connection_id in self.rooms[room_id].copy():
-            if connection_id in self.active_connections:
-                websocket = self.active_connections[connection_id]
-                try:
-                    await websocket.send_json(data)
-                except Exception as e:
-                    self.log_error(e, operation="send_json_to_room", connection_id=connection_id, room_id=room_id)
-                    disconnected.append(websocket)
+        # Serialize once and reuse the text frame for every member
+        payload = encode_json(data)
+        if await self._publish(f"{ROOM_CHANNEL_PREFIX}{room_id}", payload):
+            return
+        await self._fan_out(self._room_targets(room_id), payload, "send_json_to_room", room_id=room_id)
+    
+    async def _publish(self, channel: str, payload: str) -> bool:
+        """Publish through Redis; False means the caller should deliver locally."""
+        if self._pubsub is None:
+            return False
+        try:
+            await self.redis.publish(channel, payload)
+        except Exception as e:
+            self.log_error(e, operation="websocket_pubsub_publish", channel=channel)
+            return False
+        return True
+    
+    def _unindex_user(self, connection_id: str):
+        """Drop a connection from the user -> connections index."""
+        user_id = self.connection_metadata.get(connection_id, {}).get("user_id")
+        connections = self.user_connections.get(user_id)
+        if connections is None:
+            return
+        connections.discard(connection_id)
+        if not connections:
+            del self.user_connections[user_id]
+    
+    def _room_targets(self, room_id: str) -> List[Tuple[str, WebSocket]]:
+        """Snapshot the live connections in a room."""
+        return [
+            (connection_id, self.active_connections[connection_id])
+            for connection_id in self.rooms.get(room_id, ())
+            if connection_id in self.active_connections
+        ]
+    
+    async def _fan_out(self, targets: List[Tuple[str, WebSocket]], payload: str, operation: str, **context):
+        """Send one text frame to many connections concurrently.
+        
+        Each send is bounded by SEND_TIMEOUT_SECONDS so a stalled client can't
+        hold up the others; failed or timed-out connections are disconnected.
+        """
+        if not targets:
+            return
+        
+        results = await asyncio.gather(
+            *(asyncio.wait_for(websocket.send_text(payload), SEND_TIMEOUT_SECONDS)
+              for _, websocket in targets),
+            return_exceptions=True
+        )
         
         # Clean up disconnected clients
-        for websocket in disconnected:
-            self.disconnect(websocket)
+        for (connection_id, websocket), result in zip(targets, results):
+            if isinstance(result, Exception):
+                self.log_error(result, operation=operation, connection_id=connection_id, **context)
+                self.disconnect(websocket)
     
     def get_connection_count(self) -> int:
         """Get the number of active connections."""
@@ -198,13 +351,14 @@ class WebSocketManager(LoggerMixin):
         }
         
         if user_id:
-            # Send to specific user (find their connections)
-            user_connections = [
-                conn_id for conn_id, metadata in self.connection_metadata.items()
-                if metadata.get("user_id") == user_id
+            # Send to specific user via the user -> connections index
+            targets = [
+                (connection_id, self.active_connections[connection_id])
+                for connection_id in self.user_connections.get(user_id, ())
+                if connection_id in self.active_connections
             ]
-            for connection_id in user_connections:
-                await self.send_json_message(message, connection_id)
+            payload = encode_json(message)
+            await self._fan_out(targets, payload, "send_system_notification", user_id=user_id)
         else:
             # Broadcast to all
             await self.broadcast_json(message)
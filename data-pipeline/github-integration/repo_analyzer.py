@@ -2,17 +2,95 @@
 
 import asyncio
 import aiohttp
-from github import Github
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
+import json
 import re
 import structlog
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keywords are then scanned one by one
+    ahocorasick = None
+
 logger = structlog.get_logger()
 
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+README_FILES = ['README.md', 'README.rst', 'README.txt', 'README']
+KEY_SUBDIRS = ['src', 'models', 'scripts', 'examples']
+
+# Analyses kept per analyzer, revalidated against the repository's updatedAt/pushedAt
+ANALYSIS_CACHE_SIZE = 2048
+
+# READMEs longer than this are scored off the event loop
+LARGE_README_CHARS = 64 * 1024
+
+# Conditional-request cache for REST responses (304s don't count against the rate limit)
+ETAG_CACHE_PREFIX = "gh:etag:"
+ETAG_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Key implementation files, matched in a single pass per file name
+_KEY_FILE_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in [
+        r'.*\.py$',  # Python files
+        r'.*\.ipynb$',  # Jupyter notebooks
+        r'requirements\.txt$',
+        r'environment\.yml$',
+        r'Dockerfile$',
+        r'.*\.md$',  # Documentation
+        r'train.*\.py$',  # Training scripts
+        r'model.*\.py$',  # Model files
+        r'config.*\.(py|json|yaml)$'  # Configuration files
+    ]),
+    re.IGNORECASE
+)
+
+
+def _build_repo_query() -> str:
+    """GraphQL query fetching everything the analysis needs in one round trip."""
+    tree = "... on Tree { entries { name type } }"
+    subdirs = "\n".join(
+        f'    dir_{name}: object(expression: "HEAD:{name}") {{ {tree} }}'
+        for name in KEY_SUBDIRS
+    )
+    readmes = "\n".join(
+        f'    readme_{i}: object(expression: "HEAD:{name}") {{ ... on Blob {{ text }} }}'
+        for i, name in enumerate(README_FILES)
+    )
+    return f"""
+query($owner: String!, $name: String!) {{
+  repository(owner: $owner, name: $name) {{
+    name
+    description
+    stargazerCount
+    forkCount
+    updatedAt
+    pushedAt
+    primaryLanguage {{ name }}
+    licenseInfo {{ name }}
+    repositoryTopics(first: 20) {{ nodes {{ topic {{ name }} }} }}
+    root: object(expression: "HEAD:") {{ {tree} }}
+{subdirs}
+{readmes}
+  }}
+}}
+"""
+
+
+REPO_QUERY = _build_repo_query()
+
+VERSION_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { updatedAt pushedAt }
+}
+"""
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RepoAnalysis:
     """GitHub repository analysis results."""
     url: str
@@ -33,16 +111,105 @@ class RepoAnalysis:
     tutorial_quality: float  # 0.0 to 1.0
 
 
+# One connection pool per process (and event loop), shared by every analyzer
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_github_session() -> aiohttp.ClientSession:
+    """Process-wide keep-alive session, recreated if the event loop changed."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            headers={
+                "Accept": "application/vnd.github+json",
+                "User-Agent": "research-paper-pipeline"
+            },
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_github_session():
+    """Close the shared session (call on worker/process shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+class _AuthorizedSession:
+    """Adds a bearer token to requests made through the shared session."""
+    
+    def __init__(self, session: aiohttp.ClientSession, token: str):
+        self._session = session
+        self._auth = {"Authorization": f"Bearer {token}"}
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        return self._session.get(url, headers={**self._auth, **(headers or {})}, **kwargs)
+    
+    def post(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        return self._session.post(url, headers={**self._auth, **(headers or {})}, **kwargs)
+
+
+TUTORIAL_INDICATORS = [
+    'installation', 'usage', 'example', 'getting started',
+    'quick start', 'tutorial', 'demo', 'how to', 'step by step'
+]
+IMAGE_EXTENSIONS = ['.png', '.jpg', '.gif', '.svg']
+
+
+class _KeywordMatcher:
+    """Find which of a fixed set of keywords occur in a text in a single pass."""
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def found(self, text: str) -> set:
+        """Return the subset of keywords that appear as substrings of ``text``."""
+        if self._automaton is None:
+            return {keyword for keyword in self.keywords if keyword in text}
+        return {keyword for _, keyword in self._automaton.iter(text)}
+
+
 class GitHubRepoAnalyzer:
-    """Analyze GitHub repositories linked to research papers."""
+    """Analyze GitHub repositories linked to research papers.
+    
+    With a token, each repository is fetched with a single GraphQL query;
+    GitHub's GraphQL API requires authentication, so anonymous use falls
+    back to the REST endpoints (fetched concurrently).
+    """
     
-    def __init__(self, github_token: Optional[str] = None):
-        self.github = Github(github_token) if github_token else Github()
+    def __init__(self, github_token: Optional[str] = None, cache=None):
+        self.github_token = github_token
+        # Optional redis.asyncio client (decode_responses=True) for the ETag cache
+        self.cache = cache
+        self._analysis_cache: "OrderedDict[Tuple[str, str], Tuple[Tuple[str, str], RepoAnalysis]]" = OrderedDict()
         self.complexity_keywords = {
             'beginner': ['tutorial', 'example', 'demo', 'simple', 'basic'],
             'intermediate': ['implementation', 'model', 'training', 'inference'],
             'expert': ['research', 'paper', 'sota', 'benchmark', 'framework']
         }
+        self._readme_matcher = _KeywordMatcher(
+            [keyword for keywords in self.complexity_keywords.values() for keyword in keywords]
+            + TUTORIAL_INDICATORS + IMAGE_EXTENSIONS
+        )
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive session carrying this analyzer's credentials."""
+        session = await get_github_session()
+        if self.github_token:
+            return _AuthorizedSession(session, self.github_token)
+        return session
     
     async def analyze_repositories(self, github_urls: List[str]) -> List[RepoAnalysis]:
         """Analyze multiple GitHub repositories."""
@@ -67,133 +234,302 @@ class GitHubRepoAnalyzer:
                 return None
             
             owner, repo_name = match.groups()
-            repo = self.github.get_repo(f"{owner}/{repo_name}")
+            cache_key = (owner.lower(), repo_name.lower())
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                version, analysis = cached
+                if await self._fetch_version(owner, repo_name) == version:
+                    self._analysis_cache.move_to_end(cache_key)
+                    return analysis if analysis.url == github_url else replace(analysis, url=github_url)
+            
+            if self.github_token:
+                repo = await self._fetch_repo_graphql(owner, repo_name)
+            else:
+                repo = await self._fetch_repo_rest(owner, repo_name)
+            if repo is None:
+                return None
             
             # Get repository information
-            readme_content = await self._get_readme_content(repo)
-            key_files = await self._analyze_key_files(repo)
-            complexity = self._assess_complexity(readme_content, key_files)
-            tutorial_quality = self._assess_tutorial_quality(readme_content, key_files)
+            readme_content = repo["readme"]
+            key_files = self._analyze_key_files(repo["files"])
+            if readme_content and len(readme_content) > LARGE_README_CHARS:
+                # Keep the loop free for other repositories' requests while scoring
+                loop = asyncio.get_running_loop()
+                complexity, tutorial_quality = await loop.run_in_executor(
+                    None, self._score_readme, readme_content, key_files
+                )
+            else:
+                complexity, tutorial_quality = self._score_readme(readme_content, key_files)
+            root_files = repo["files"][""]
             
-            return RepoAnalysis(
+            analysis = RepoAnalysis(
                 url=github_url,
-                name=repo.name,
-                description=repo.description,
-                stars=repo.stargazers_count,
-                forks=repo.forks_count,
-                language=repo.language,
-                topics=repo.get_topics(),
+                name=repo["name"],
+                description=repo["description"],
+                stars=repo["stars"],
+                forks=repo["forks"],
+                language=repo["language"],
+                topics=repo["topics"],
                 readme_content=readme_content,
                 key_files=key_files,
-                has_requirements=self._has_file(repo, ['requirements.txt', 'environment.yml', 'pyproject.toml']),
-                has_dockerfile=self._has_file(repo, ['Dockerfile', 'docker-compose.yml']),
-                has_notebook=self._has_file(repo, ['.ipynb']),
-                last_updated=repo.updated_at,
-                license=repo.license.name if repo.license else None,
+                has_requirements=self._has_file(root_files, ['requirements.txt', 'environment.yml', 'pyproject.toml']),
+                has_dockerfile=self._has_file(root_files, ['Dockerfile', 'docker-compose.yml']),
+                has_notebook=self._has_file(root_files, ['.ipynb']),
+                last_updated=repo["updated_at"],
+                license=repo["license"],
                 implementation_complexity=complexity,
                 tutorial_quality=tutorial_quality
             )
+            
+            self._analysis_cache[cache_key] = (repo["version"], analysis)
+            self._analysis_cache.move_to_end(cache_key)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+            return analysis
         
         except Exception as e:
             logger.error(f"Error analyzing repository {github_url}: {e}")
             return None
     
-    async def _get_readme_content(self, repo) -> Optional[str]:
-        """Get README content from repository."""
+    async def _fetch_version(self, owner: str, repo_name: str) -> Optional[Tuple[str, str]]:
+        """Cheap (updatedAt, pushedAt) probe used to revalidate a cached analysis."""
         try:
-            readme_files = ['README.md', 'README.rst', 'README.txt', 'README']
-            
-            for readme_file in readme_files:
-                try:
-                    content = repo.get_contents(readme_file)
-                    return content.decoded_content.decode('utf-8')
-                except:
-                    continue
+            if self.github_token:
+                session = await self._get_session()
+                async with session.post(
+                    GITHUB_GRAPHQL_URL,
+                    json={"query": VERSION_QUERY, "variables": {"owner": owner, "name": repo_name}}
+                ) as response:
+                    response.raise_for_status()
+                    data = ((await response.json()).get("data") or {}).get("repository")
+                return (data["updatedAt"], data.get("pushedAt")) if data else None
             
+            # Conditional request; a 304 is served from the ETag cache
+            data = await self._get_json(f"{GITHUB_API_URL}/repos/{owner}/{repo_name}")
+            return (data["updated_at"], data.get("pushed_at")) if data else None
+        except Exception as e:
+            logger.error(f"Error checking repository version {owner}/{repo_name}: {e}")
             return None
+    
+    async def _fetch_repo_graphql(self, owner: str, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch metadata, file listing and README with one GraphQL query."""
+        session = await self._get_session()
+        async with session.post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": REPO_QUERY, "variables": {"owner": owner, "name": repo_name}}
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json()
+        
+        data = (payload.get("data") or {}).get("repository")
+        if not data:
+            logger.error(f"GraphQL lookup failed for {owner}/{repo_name}: {payload.get('errors')}")
+            return None
+        
+        def file_names(tree) -> List[str]:
+            if not tree:
+                return []
+            return [entry["name"] for entry in tree["entries"] if entry["type"] == "blob"]
+        
+        root_entries = (data.get("root") or {}).get("entries", [])
+        root_dirs = {entry["name"] for entry in root_entries if entry["type"] == "tree"}
+        files = {"": file_names(data.get("root"))}
+        for subdir in KEY_SUBDIRS:
+            if subdir in root_dirs:
+                files[subdir] = file_names(data.get(f"dir_{subdir}"))
+        
+        readme = next(
+            (blob["text"] for blob in (data.get(f"readme_{i}") for i in range(len(README_FILES)))
+             if blob and blob.get("text") is not None),
+            None
+        )
+        
+        return {
+            "name": data["name"],
+            "description": data["description"],
+            "stars": data["stargazerCount"],
+            "forks": data["forkCount"],
+            "language": (data.get("primaryLanguage") or {}).get("name"),
+            "topics": [node["topic"]["name"] for node in data["repositoryTopics"]["nodes"]],
+            "license": (data.get("licenseInfo") or {}).get("name"),
+            "updated_at": self._parse_timestamp(data["updatedAt"]),
+            "version": (data["updatedAt"], data.get("pushedAt")),
+            "readme": readme,
+            "files": files
+        }
+    
+    async def _fetch_repo_rest(self, owner: str, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Anonymous fallback: repo, root listing and README requested concurrently."""
+        base = f"{GITHUB_API_URL}/repos/{owner}/{repo_name}"
+        data, root, readme = await asyncio.gather(
+            self._get_json(base),
+            self._get_json(f"{base}/contents/"),
+            self._get_readme_content(base)
+        )
+        if data is None:
+            return None
+        
+        root = root or []
+        files = {"": [item["name"] for item in root if item["type"] == "file"]}
+        subdirs = [
+            item["name"] for item in root
+            if item["type"] == "dir" and item["name"] in KEY_SUBDIRS
+        ]
+        listings = await asyncio.gather(*(self._get_json(f"{base}/contents/{name}") for name in subdirs))
+        for subdir, listing in zip(subdirs, listings):
+            files[subdir] = [item["name"] for item in listing or [] if item["type"] == "file"]
+        
+        return {
+            "name": data["name"],
+            "description": data["description"],
+            "stars": data["stargazers_count"],
+            "forks": data["forks_count"],
+            "language": data["language"],
+            "topics": data.get("topics", []),
+            "license": (data.get("license") or {}).get("name"),
+            "updated_at": self._parse_timestamp(data["updated_at"]),
+            "version": (data["updated_at"], data.get("pushed_at")),
+            "readme": readme,
+            "files": files
+        }
+    
+    async def _get_json(self, url: str) -> Optional[Any]:
+        """GET a REST resource, returning None when it does not exist."""
+        body = await self._conditional_get(url)
+        return json.loads(body) if body is not None else None
+    
+    async def _get_readme_content(self, repo_url: str) -> Optional[str]:
+        """Get README content from repository."""
+        try:
+            return await self._conditional_get(
+                f"{repo_url}/readme", accept="application/vnd.github.raw"
+            )
         except Exception as e:
             logger.error(f"Error getting README: {e}")
             return None
     
-    async def _analyze_key_files(self, repo) -> List[str]:
-        """Analyze key files in the repository."""
-        key_files = []
+    async def _conditional_get(self, url: str, accept: Optional[str] = None) -> Optional[str]:
+        """GET a REST resource body, revalidating any cached copy with If-None-Match."""
+        key = self._etag_key(url)
+        cached = await self._etag_lookup(key)
         
-        try:
-            contents = repo.get_contents("")
-            
-            important_patterns = [
-                r'.*\.py$',  # Python files
-                r'.*\.ipynb$',  # Jupyter notebooks
-                r'requirements\.txt$',
-                r'environment\.yml$',
-                r'Dockerfile$',
-                r'.*\.md$',  # Documentation
-                r'train.*\.py$',  # Training scripts
-                r'model.*\.py$',  # Model files
-                r'config.*\.(py|json|yaml)$'  # Configuration files
-            ]
-            
-            for content_file in contents:
-                if content_file.type == "file":
-                    for pattern in important_patterns:
-                        if re.match(pattern, content_file.name, re.IGNORECASE):
-                            key_files.append(content_file.name)
-                            break
-            
-            # Also check subdirectories for important files
-            for content_file in contents:
-                if content_file.type == "dir" and content_file.name in ['src', 'models', 'scripts', 'examples']:
-                    try:
-                        subdir_contents = repo.get_contents(content_file.path)
-                        for subfile in subdir_contents:
-                            if subfile.type == "file":
-                                for pattern in important_patterns:
-                                    if re.match(pattern, subfile.name, re.IGNORECASE):
-                                        key_files.append(f"{content_file.name}/{subfile.name}")
-                                        break
-                    except:
-                        continue
+        headers = {"Accept": accept} if accept else {}
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
         
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                await self._etag_touch(key)
+                return cached["body"]
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            body = await response.text()
+            etag = response.headers.get("ETag")
+        
+        if etag:
+            await self._etag_store(key, etag, body)
+        return body
+    
+    @staticmethod
+    def _etag_key(url: str) -> str:
+        """Cache key of the form gh:etag:{owner}/{repo}:{path}."""
+        owner, repo, *path = url[len(f"{GITHUB_API_URL}/repos/"):].split("/", 2)
+        return f"{ETAG_CACHE_PREFIX}{owner}/{repo}:{path[0] if path else ''}"
+    
+    async def _etag_lookup(self, key: str) -> Optional[Dict[str, str]]:
+        """Cached ETag and body for a resource, treating cache errors as a miss."""
+        if self.cache is None:
+            return None
+        try:
+            return await self.cache.hgetall(key) or None
+        except Exception as e:
+            logger.error(f"ETag cache read failed: {e}")
+            return None
+    
+    async def _etag_touch(self, key: str):
+        """Refresh the TTL of a revalidated entry without rewriting its body."""
+        if self.cache is None:
+            return
+        try:
+            await self.cache.expire(key, ETAG_CACHE_TTL_SECONDS)
         except Exception as e:
-            logger.error(f"Error analyzing key files: {e}")
+            logger.error(f"ETag cache write failed: {e}")
+    
+    async def _etag_store(self, key: str, etag: str, body: str):
+        """Store a resource's ETag and body."""
+        if self.cache is None:
+            return
+        try:
+            async with self.cache.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping={"etag": etag, "body": body})
+                pipe.expire(key, ETAG_CACHE_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"ETag cache write failed: {e}")
+    
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse a GitHub ISO-8601 timestamp into a naive UTC datetime."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+    
+    def _analyze_key_files(self, files: Dict[str, List[str]]) -> List[str]:
+        """Analyze key files in the repository.
+        
+        ``files`` maps a directory ('' for the root) to the file names it contains.
+        """
+        key_files = []
+        
+        for name in files.get("", []):
+            if _KEY_FILE_RE.match(name):
+                key_files.append(name)
+        
+        # Also check subdirectories for important files
+        for subdir in KEY_SUBDIRS:
+            for name in files.get(subdir, []):
+                if _KEY_FILE_RE.match(name):
+                    key_files.append(f"{subdir}/{name}")
         
         return key_files[:20]  # Limit to top 20 files
     
-    def _has_file(self, repo, filenames: List[str]) -> bool:
-        """Check if repository has any of the specified files."""
-        try:
-            contents = repo.get_contents("")
-            repo_files = [f.name.lower() for f in contents if f.type == "file"]
-            
-            for filename in filenames:
-                if filename.lower() in repo_files:
-                    return True
-                
-                # Check for pattern matches (e.g., .ipynb extension)
-                if filename.startswith('.'):
-                    for repo_file in repo_files:
-                        if repo_file.endswith(filename):
-                            return True
+    def _has_file(self, root_files: List[str], filenames: List[str]) -> bool:
+        """Check if the repository root has any of the specified files."""
+        repo_files = [name.lower() for name in root_files]
+        
+        for filename in filenames:
+            if filename.lower() in repo_files:
+                return True
             
-            return False
-        except:
-            return False
+            # Check for pattern matches (e.g., .ipynb extension)
+            if filename.startswith('.'):
+                for repo_file in repo_files:
+                    if repo_file.endswith(filename):
+                        return True
+        
+        return False
+    
+    def _score_readme(self, readme_content: Optional[str], key_files: List[str]) -> Tuple[str, float]:
+        """Complexity level and tutorial quality for a repository."""
+        return (
+            self._assess_complexity(readme_content, key_files),
+            self._assess_tutorial_quality(readme_content, key_files)
+        )
     
     def _assess_complexity(self, readme_content: Optional[str], key_files: List[str]) -> str:
         """Assess implementation complexity based on content."""
         if not readme_content:
             readme_content = ""
         
-        readme_lower = readme_content.lower()
+        found = self._readme_matcher.found(readme_content.lower())
         
         # Count complexity indicators
         beginner_score = sum(1 for keyword in self.complexity_keywords['beginner'] 
-                           if keyword in readme_lower)
+                           if keyword in found)
         intermediate_score = sum(1 for keyword in self.complexity_keywords['intermediate'] 
-                               if keyword in readme_lower)
+                               if keyword in found)
         expert_score = sum(1 for keyword in self.complexity_keywords['expert'] 
-                         if keyword in readme_lower)
+                         if keyword in found)
         
         # Adjust scores based on file structure
         if any('train' in f.lower() for f in key_files):
@@ -219,16 +555,11 @@ class GitHubRepoAnalyzer:
             return 0.0
         
         quality_score = 0.0
-        readme_lower = readme_content.lower()
+        found = self._readme_matcher.found(readme_content.lower())
         
         # Check for tutorial elements
-        tutorial_indicators = [
-            'installation', 'usage', 'example', 'getting started',
-            'quick start', 'tutorial', 'demo', 'how to', 'step by step'
-        ]
-        
-        for indicator in tutorial_indicators:
-            if indicator in readme_lower:
+        for indicator in TUTORIAL_INDICATORS:
+            if indicator in found:
                 quality_score += 0.1
         
         # Check for code examples
@@ -236,7 +567,7 @@ class GitHubRepoAnalyzer:
             quality_score += 0.2
         
         # Check for images/diagrams
-        if any(ext in readme_lower for ext in ['.png', '.jpg', '.gif', '.svg']):
+        if any(ext in found for ext in IMAGE_EXTENSIONS):
             quality_score += 0.1
         
         # Check for example files
@@ -1,16 +1,46 @@
 """arXiv API client for fetching research papers."""
 
 import asyncio
-import arxiv
-from typing import List, Optional, Dict, Any
+import aiohttp
+from collections import deque
+from io import BytesIO
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import structlog
 
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; the stdlib parser streams the same events, just slower
+    import xml.etree.ElementTree as etree
+
 logger = structlog.get_logger()
 
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+# Pages requested ahead of the consumer; submissions are still spaced by delay_seconds
+ARXIV_PREFETCH_PAGES = 3
+ARXIV_NUM_RETRIES = 3
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+_ENTRY = f"{_ATOM}entry"
+_TOTAL_RESULTS = f"{_OPENSEARCH}totalResults"
+
+# AI-related categories
+AI_CATEGORIES = [
+    "cs.AI",  # Artificial Intelligence
+    "cs.LG",  # Machine Learning
+    "cs.CL",  # Computation and Language (NLP)
+    "cs.CV",  # Computer Vision
+    "cs.NE",  # Neural and Evolutionary Computing
+    "cs.RO",  # Robotics
+    "stat.ML"  # Machine Learning (Statistics)
+]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ArxivPaper:
     """Data class for arXiv paper information."""
     arxiv_id: str
@@ -31,98 +61,60 @@ class ArxivClient:
     def __init__(self, max_results: int = 100, delay_seconds: float = 3.0):
         self.max_results = max_results
         self.delay_seconds = delay_seconds
-        self.client = arxiv.Client(
-            page_size=min(max_results, 100),
-            delay_seconds=delay_seconds,
-            num_retries=3
-        )
+        self.page_size = min(max_results, 100)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pace_lock: Optional[asyncio.Lock] = None
+        self._next_request_at = 0.0
     
     async def fetch_ai_papers(self, days_back: int = 7) -> List[ArxivPaper]:
         """Fetch recent AI papers from arXiv."""
+        papers = []
+        try:
+            async for paper in self.iter_ai_papers(days_back):
+                papers.append(paper)
+            logger.info(f"Fetched {len(papers)} papers from {len(AI_CATEGORIES)} categories")
+        except Exception as e:
+            logger.error(f"Error fetching AI papers: {e}")
+        return papers
+    
+    def iter_ai_papers(self, days_back: int = 7) -> AsyncIterator[ArxivPaper]:
+        """Stream recent AI papers page by page instead of materializing them all."""
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
-        
-        # AI-related categories
-        ai_categories = [
-            "cs.AI",  # Artificial Intelligence
-            "cs.LG",  # Machine Learning
-            "cs.CL",  # Computation and Language (NLP)
-            "cs.CV",  # Computer Vision
-            "cs.NE",  # Neural and Evolutionary Computing
-            "cs.RO",  # Robotics
-            "stat.ML"  # Machine Learning (Statistics)
-        ]
-        
-        papers = []
-        for category in ai_categories:
-            try:
-                category_papers = await self._fetch_by_category(
-                    category, start_date, end_date
-                )
-                papers.extend(category_papers)
-                logger.info(f"Fetched {len(category_papers)} papers from {category}")
-            except Exception as e:
-                logger.error(f"Error fetching from {category}: {e}")
-        
-        # Remove duplicates by arxiv_id
-        unique_papers = {paper.arxiv_id: paper for paper in papers}
-        return list(unique_papers.values())
+        return self._iter_by_categories(AI_CATEGORIES, start_date, end_date)
     
-    async def _fetch_by_category(
+    async def _iter_by_categories(
         self, 
-        category: str, 
+        categories: List[str], 
         start_date: datetime, 
         end_date: datetime
-    ) -> List[ArxivPaper]:
-        """Fetch papers by category and date range."""
-        query = f"cat:{category} AND submittedDate:[{start_date.strftime('%Y%m%d')} TO {end_date.strftime('%Y%m%d')}]"
+    ) -> AsyncIterator[ArxivPaper]:
+        """Stream papers in any of the categories with one OR-query (no cross-category duplicates)."""
+        category_filter = " OR ".join(f"cat:{category}" for category in categories)
+        query = f"({category_filter}) AND submittedDate:[{start_date.strftime('%Y%m%d')} TO {end_date.strftime('%Y%m%d')}]"
         
-        search = arxiv.Search(
-            query=query,
-            max_results=self.max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending
-        )
+        params = {
+            "search_query": query,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending"
+        }
+        # Same result budget the per-category searches used to have between them
+        max_results = self.max_results * len(categories)
         
-        papers = []
-        for result in self.client.results(search):
-            try:
-                paper = ArxivPaper(
-                    arxiv_id=result.entry_id.split('/')[-1],
-                    title=result.title.strip(),
-                    abstract=result.summary.strip(),
-                    authors=[author.name for author in result.authors],
-                    categories=result.categories,
-                    published_date=result.published,
-                    updated_date=result.updated,
-                    pdf_url=result.pdf_url,
-                    doi=result.doi,
-                    journal=result.journal_ref
-                )
-                papers.append(paper)
-            except Exception as e:
-                logger.error(f"Error processing paper {result.entry_id}: {e}")
-        
-        return papers
+        # Pages can overlap when new submissions shift the ordering mid-fetch
+        seen = set()
+        async for paper in self._iter_query(params, max_results):
+            if paper.arxiv_id in seen:
+                continue
+            seen.add(paper.arxiv_id)
+            yield paper
     
     async def fetch_paper_by_id(self, arxiv_id: str) -> Optional[ArxivPaper]:
         """Fetch a specific paper by arXiv ID."""
         try:
-            search = arxiv.Search(id_list=[arxiv_id])
-            result = next(self.client.results(search))
-            
-            return ArxivPaper(
-                arxiv_id=result.entry_id.split('/')[-1],
-                title=result.title.strip(),
-                abstract=result.summary.strip(),
-                authors=[author.name for author in result.authors],
-                categories=result.categories,
-                published_date=result.published,
-                updated_date=result.updated,
-                pdf_url=result.pdf_url,
-                doi=result.doi,
-                journal=result.journal_ref
-            )
+            _, papers = await self._fetch_page({"id_list": arxiv_id}, 0, 1)
+            return papers[0] if papers else None
         except Exception as e:
             logger.error(f"Error fetching paper {arxiv_id}: {e}")
             return None
@@ -133,29 +125,155 @@ class ArxivClient:
         max_results: int = 50
     ) -> List[ArxivPaper]:
         """Search papers by query string."""
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.Relevance
-        )
+        return [paper async for paper in self.iter_search_papers(query, max_results)]
+    
+    def iter_search_papers(
+        self, 
+        query: str, 
+        max_results: int = 50
+    ) -> AsyncIterator[ArxivPaper]:
+        """Stream search results page by page."""
+        params = {"search_query": query, "sortBy": "relevance", "sortOrder": "descending"}
+        return self._iter_query(params, max_results)
+    
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _iter_query(self, params: Dict[str, str], max_results: int) -> AsyncIterator[ArxivPaper]:
+        """Yield a query's results in order while the next pages are already in flight.
         
-        papers = []
-        for result in self.client.results(search):
+        The first page reports the total result count; up to
+        ``ARXIV_PREFETCH_PAGES`` later pages are then requested ahead of the
+        consumer, with request submissions still spaced by ``delay_seconds``.
+        """
+        total, papers = await self._fetch_page(params, 0, min(self.page_size, max_results))
+        for paper in papers:
+            yield paper
+        
+        total = min(total, max_results)
+        starts = iter(range(self.page_size, total, self.page_size))
+        pending: deque = deque()
+        
+        def schedule_next():
+            start = next(starts, None)
+            if start is not None:
+                pending.append(asyncio.ensure_future(
+                    self._fetch_page(params, start, min(self.page_size, total - start))
+                ))
+        
+        for _ in range(ARXIV_PREFETCH_PAGES):
+            schedule_next()
+        try:
+            while pending:
+                _, papers = await pending.popleft()
+                schedule_next()
+                for paper in papers:
+                    yield paper
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _fetch_page(
+        self, 
+        params: Dict[str, str], 
+        start: int, 
+        max_results: int
+    ) -> Tuple[int, List[ArxivPaper]]:
+        """Fetch and parse one page, retrying failures and spurious empty pages."""
+        query = {**params, "start": str(start), "max_results": str(max_results)}
+        last_error: Optional[Exception] = None
+        
+        for attempt in range(ARXIV_NUM_RETRIES + 1):
             try:
-                paper = ArxivPaper(
-                    arxiv_id=result.entry_id.split('/')[-1],
-                    title=result.title.strip(),
-                    abstract=result.summary.strip(),
-                    authors=[author.name for author in result.authors],
-                    categories=result.categories,
-                    published_date=result.published,
-                    updated_date=result.updated,
-                    pdf_url=result.pdf_url,
-                    doi=result.doi,
-                    journal=result.journal_ref
-                )
-                papers.append(paper)
-            except Exception as e:
-                logger.error(f"Error processing search result: {e}")
+                await self._wait_for_slot()
+                session = await self._get_session()
+                async with session.get(ARXIV_API_URL, params=query) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+                total, papers = self._parse_feed(body)
+                # arXiv occasionally returns an empty page mid-result-set; retry those
+                if papers or start >= total:
+                    return total, papers
+                last_error = RuntimeError(f"empty page at start={start} of {total}")
+            except (aiohttp.ClientError, asyncio.TimeoutError, etree.ParseError) as e:
+                last_error = e
+            logger.warning(f"arXiv page fetch failed (attempt {attempt + 1}): {last_error}")
         
-        return papers
\ No newline at end of file
+        raise last_error
+    
+    async def _wait_for_slot(self):
+        """Space request submissions ``delay_seconds`` apart (arXiv's API usage policy)."""
+        loop = asyncio.get_running_loop()
+        if self._pace_lock is None or self._session_loop is not loop:
+            await self._get_session()
+        async with self._pace_lock:
+            delay = self._next_request_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request_at = loop.time() + self.delay_seconds
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session (and pacing state), recreated if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=ARXIV_PREFETCH_PAGES + 1, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._session_loop = loop
+            self._pace_lock = asyncio.Lock()
+            self._next_request_at = 0.0
+        return self._session
+    
+    @classmethod
+    def _parse_feed(cls, body: bytes) -> Tuple[int, List[ArxivPaper]]:
+        """Stream-parse an Atom response into (total results, papers).
+        
+        Entries are converted as soon as they close and then cleared, so a
+        page never holds more than one parsed entry tree at a time.
+        """
+        total = 0
+        papers = []
+        for _, elem in etree.iterparse(BytesIO(body)):
+            if elem.tag == _ENTRY:
+                try:
+                    papers.append(cls._to_paper(elem))
+                except Exception as e:
+                    logger.error(f"Error processing paper {elem.findtext(f'{_ATOM}id')}: {e}")
+                elem.clear()
+            elif elem.tag == _TOTAL_RESULTS:
+                total = int(elem.text or 0)
+        return total, papers
+    
+    @staticmethod
+    def _to_paper(entry) -> ArxivPaper:
+        """Convert an Atom entry into an ArxivPaper."""
+        entry_id = entry.findtext(f"{_ATOM}id")
+        if "/api/errors" in entry_id:
+            raise ValueError(entry.findtext(f"{_ATOM}summary"))
+        
+        pdf_url = next(
+            (link.get("href") for link in entry.findall(f"{_ATOM}link") if link.get("title") == "pdf"),
+            None
+        )
+        
+        return ArxivPaper(
+            arxiv_id=entry_id.split('/')[-1],
+            title=entry.findtext(f"{_ATOM}title").strip(),
+            abstract=entry.findtext(f"{_ATOM}summary").strip(),
+            authors=[author.findtext(f"{_ATOM}name") for author in entry.findall(f"{_ATOM}author")],
+            categories=[category.get("term") for category in entry.findall(f"{_ATOM}category")],
+            published_date=_parse_timestamp(entry.findtext(f"{_ATOM}published")),
+            updated_date=_parse_timestamp(entry.findtext(f"{_ATOM}updated")),
+            pdf_url=pdf_url,
+            doi=entry.findtext(f"{_ARXIV}doi"),
+            journal=entry.findtext(f"{_ARXIV}journal_ref")
+        )
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an Atom timestamp into an aware UTC datetime."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
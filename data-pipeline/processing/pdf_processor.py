@@ -2,15 +2,191 @@
 
 import asyncio
 import aiohttp
-from typing import Optional, Dict, Any, List
-import PyPDF2
+import heapq
+import io
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Union
 import pdfplumber
+import pypdfium2 as pdfium
 import re
 from dataclasses import dataclass
 import structlog
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keywords are then scanned one by one
+    ahocorasick = None
+
 logger = structlog.get_logger()
 
+# Batch parses hand papers to each pool worker this many at a time
+PARSE_CHUNKSIZE = 4
+
+# Downloads stay in memory up to this size, then spill to a named temporary file
+PDF_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+PDF_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Common ML/AI methodology terms
+METHOD_KEYWORDS = [
+    'neural network', 'deep learning', 'machine learning', 'transformer',
+    'attention', 'convolution', 'lstm', 'gru', 'bert', 'gpt',
+    'reinforcement learning', 'supervised learning', 'unsupervised learning',
+    'classification', 'regression', 'clustering', 'optimization',
+    'gradient descent', 'backpropagation', 'fine-tuning', 'pre-training'
+]
+
+
+def _build_automaton(keywords: List[str]):
+    """Build a keyword automaton once per process (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_METHOD_AUTOMATON = _build_automaton(METHOD_KEYWORDS)
+
+# Section header keywords, in priority order
+SECTION_KEYWORDS = {
+    'abstract': ['abstract'],
+    'introduction': ['introduction'],
+    'methodology': ['methodology', 'method', 'approach'],
+    'results': ['results', 'experiments', 'evaluation'],
+    'conclusion': ['conclusion', 'discussion'],
+    'references': ['references', 'bibliography']
+}
+
+_SECTION_ALIASES = {
+    keyword: section for section, keywords in SECTION_KEYWORDS.items() for keyword in keywords
+}
+_SECTION_PRIORITY = {section: rank for rank, section in enumerate(SECTION_KEYWORDS)}
+
+# Every header keyword in one alternation: a single scan per lowercased line
+_SECTION_RE = re.compile(r'\b(?P<name>' + '|'.join(_SECTION_ALIASES) + r')\b')
+
+# Sentences with performance metrics, in reporting order
+METRIC_PATTERNS = [
+    r'accuracy of (\d+\.?\d*%?)',
+    r'f1[- ]score of (\d+\.?\d*)',
+    r'precision of (\d+\.?\d*%?)',
+    r'recall of (\d+\.?\d*%?)',
+    r'improved? by (\d+\.?\d*%?)',
+    r'outperform[s]? .* by (\d+\.?\d*%?)',
+    r'achieve[s]? (\d+\.?\d*%?) accuracy'
+]
+
+# Matched against lowercased text; the IGNORECASE variant is the fallback for
+# text whose offsets change when lowercased
+_METRIC_ALTERNATION = '|'.join(f'(?P<m{index}>{pattern})' for index, pattern in enumerate(METRIC_PATTERNS))
+_METRIC_RE = re.compile(_METRIC_ALTERNATION)
+_METRIC_RE_ANY_CASE = re.compile(_METRIC_ALTERNATION, re.IGNORECASE)
+
+# Every metric pattern contains one of these literals; text without any of
+# them cannot match, so the metric regex is skipped
+FINDING_ANCHORS = ['accuracy', 'f1', 'precision', 'recall', 'improv', 'outperform', 'achieve']
+_FINDING_AUTOMATON = _build_automaton(FINDING_ANCHORS)
+
+# GitHub owner and repository names are ASCII, at most 39 and 100 characters;
+# ASCII mode keeps case-insensitive matching to cheap ASCII folding
+_GITHUB_URL_RE = re.compile(
+    r'https?://(?:www\.)?github\.com/[\w\-\.]{1,39}/[\w\-\.]{1,100}',
+    re.IGNORECASE | re.ASCII
+)
+_GITHUB_HOST = 'github.com/'
+# Scheme prefixes that may precede the host, longest first
+_GITHUB_URL_PREFIXES = ('https://www.', 'http://www.', 'https://', 'http://')
+
+# Reference entries start a line with "[n]" or "n."
+_REF_SPLIT_RE = re.compile(r'\n(?=\[\d+\]|\d+\.)')
+
+
+class _PDFSpool:
+    """Download buffer kept in memory until it outgrows ``PDF_SPOOL_MAX_BYTES``.
+    
+    Unlike ``tempfile.SpooledTemporaryFile`` it spills to a *named* file, so
+    a parse worker in another process can open it by path.
+    """
+    
+    def __init__(self):
+        self._buffer: Optional[io.BytesIO] = io.BytesIO()
+        self._file = None
+    
+    def write(self, chunk: bytes):
+        if self._file is None and self._buffer.tell() + len(chunk) > PDF_SPOOL_MAX_BYTES:
+            self._file = tempfile.NamedTemporaryFile(suffix=".pdf")
+            self._file.write(self._buffer.getbuffer())
+            self._buffer = None
+        (self._file or self._buffer).write(chunk)
+    
+    def source(self) -> Union[bytes, str]:
+        """What ``_parse_pdf`` needs: the bytes, or the spilled file's path."""
+        if self._file is None:
+            return self._buffer.getvalue()
+        self._file.flush()
+        return self._file.name
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        self._buffer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _parse_pdf(source: Union[bytes, str]) -> Tuple[str, int, int]:
+    """Extract (full text, figure count, table count) from PDF bytes or a path.
+    
+    Runs in a parse worker process, so it only returns primitives.
+    """
+    # Page texts are joined once at the end rather than concatenated per page
+    pages: List[str] = []
+    figures_count = 0
+    tables_count = 0
+    
+    # Use pdfplumber for better text extraction
+    try:
+        with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    pages.append(page_text)
+                
+                # Count figures and tables (find_tables locates tables without
+                # reconstructing their cell text, which is all a count needs)
+                figures_count += len(page.images)
+                tables_count += len(page.find_tables())
+    except Exception as e:
+        logger.warning(f"pdfplumber failed, trying pypdfium2: {e}")
+        # Fallback to PDFium (C++), which accepts the bytes or path directly
+        pages = []
+        try:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                for page in pdf:
+                    text_page = page.get_textpage()
+                    # PDFium separates lines with CRLF; match pdfplumber's LF
+                    pages.append(text_page.get_text_range().replace("\r\n", "\n"))
+                    text_page.close()
+                    page.close()
+            finally:
+                pdf.close()
+        except Exception as e2:
+            logger.error(f"Both PDF processors failed: {e2}")
+            pages = []
+    
+    full_text = "".join(f"{page_text}\n" for page_text in pages)
+    return full_text, figures_count, tables_count
+
 
 @dataclass
 class ProcessedPaper:
@@ -25,86 +201,143 @@ class ProcessedPaper:
     tables_count: int
 
 
+# One parse pool per process, shared by every processor
+_parse_pool: Optional[Executor] = None
+
+
+def get_parse_pool() -> Optional[Executor]:
+    """Process-wide pool for PDF parsing, or None (the loop's thread pool).
+    
+    Workers are spawned rather than forked: the pool may be started while
+    other threads (the event loop, executor threads) hold locks. Daemonic
+    processes such as Celery prefork workers cannot start children, so they
+    parse on threads instead.
+    """
+    global _parse_pool
+    if _parse_pool is None and not multiprocessing.current_process().daemon:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the shared parse workers (call on worker/process shutdown)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
 class PDFProcessor:
     """Process PDF papers to extract structured content."""
     
     def __init__(self):
-        self.github_pattern = re.compile(
-            r'https?://(?:www\.)?github\.com/[\w\-\.]+/[\w\-\.]+',
-            re.IGNORECASE
-        )
-        self.section_patterns = {
-            'abstract': re.compile(r'\babstract\b', re.IGNORECASE),
-            'introduction': re.compile(r'\bintroduction\b', re.IGNORECASE),
-            'methodology': re.compile(r'\b(?:methodology|method|approach)\b', re.IGNORECASE),
-            'results': re.compile(r'\b(?:results|experiments|evaluation)\b', re.IGNORECASE),
-            'conclusion': re.compile(r'\b(?:conclusion|discussion)\b', re.IGNORECASE),
-            'references': re.compile(r'\b(?:references|bibliography)\b', re.IGNORECASE)
-        }
+        self.github_pattern = _GITHUB_URL_RE
+        self._section_re = _SECTION_RE
+        self._metric_re = _METRIC_RE
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Keep-alive session shared by all downloads, recreated if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=30
+                ),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+            self._session_loop = loop
+        return self._session
     
     async def download_and_process_pdf(self, pdf_url: str) -> Optional[ProcessedPaper]:
         """Download PDF and extract structured content."""
         try:
-            pdf_content = await self._download_pdf(pdf_url)
-            if not pdf_content:
+            pdf_file = await self._download_pdf(pdf_url)
+            if pdf_file is None:
                 return None
             
-            return await self._process_pdf_content(pdf_content)
+            with pdf_file:
+                return await self._process_pdf_content(pdf_file)
         except Exception as e:
             logger.error(f"Error processing PDF {pdf_url}: {e}")
             return None
     
-    async def _download_pdf(self, pdf_url: str) -> Optional[bytes]:
-        """Download PDF content."""
+    async def process_pdfs(self, pdf_urls: List[Optional[str]]) -> List[Optional[ProcessedPaper]]:
+        """Download and process a batch of PDFs, in input order (None where a PDF failed).
+        
+        Downloads run concurrently; parsing and extraction for the whole batch
+        then go through a single pool ``map`` so worker dispatch is amortized.
+        """
+        async def download(pdf_url: Optional[str]) -> Optional[_PDFSpool]:
+            return await self._download_pdf(pdf_url) if pdf_url else None
+        
+        pdf_files = await asyncio.gather(*(download(pdf_url) for pdf_url in pdf_urls))
+        try:
+            sources = [pdf_file.source() for pdf_file in pdf_files if pdf_file is not None]
+            pool = get_parse_pool()
+            
+            def extract_all() -> List[Optional[ProcessedPaper]]:
+                if pool is None:
+                    return list(map(_extract_paper_or_none, sources))
+                return list(pool.map(_extract_paper_or_none, sources, chunksize=PARSE_CHUNKSIZE))
+            
+            loop = asyncio.get_running_loop()
+            extracted = iter(await loop.run_in_executor(None, extract_all))
+            return [next(extracted) if pdf_file is not None else None for pdf_file in pdf_files]
+        finally:
+            for pdf_file in pdf_files:
+                if pdf_file is not None:
+                    pdf_file.close()
+    
+    async def _download_pdf(self, pdf_url: str) -> Optional[_PDFSpool]:
+        """Stream the PDF into a spool (memory, spilling to a temporary file)."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(pdf_url) as response:
-                    if response.status == 200:
-                        return await response.read()
-            return None
+            session = await self._get_session()
+            async with session.get(pdf_url) as response:
+                if response.status != 200:
+                    return None
+                
+                spool = _PDFSpool()
+                try:
+                    async for chunk in response.content.iter_chunked(PDF_DOWNLOAD_CHUNK_BYTES):
+                        spool.write(chunk)
+                except BaseException:
+                    spool.close()
+                    raise
+                return spool
         except Exception as e:
             logger.error(f"Error downloading PDF {pdf_url}: {e}")
             return None
     
-    async def _process_pdf_content(self, pdf_content: bytes) -> ProcessedPaper:
-        """Extract structured content from PDF."""
-        # Use pdfplumber for better text extraction
-        full_text = ""
-        sections = {}
-        figures_count = 0
-        tables_count = 0
-        
-        try:
-            import io
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        full_text += page_text + "\n"
-                    
-                    # Count figures and tables
-                    figures_count += len(page.images)
-                    tables_count += len(page.extract_tables())
-        except Exception as e:
-            logger.warning(f"pdfplumber failed, trying PyPDF2: {e}")
-            # Fallback to PyPDF2
-            try:
-                import io
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
-                for page in pdf_reader.pages:
-                    full_text += page.extract_text() + "\n"
-            except Exception as e2:
-                logger.error(f"Both PDF processors failed: {e2}")
-                full_text = ""
+    async def _process_pdf_content(self, pdf_file: _PDFSpool) -> ProcessedPaper:
+        """Extract structured content from a downloaded PDF."""
+        # Parsing and extraction are CPU-bound; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_parse_pool(), _extract_paper, pdf_file.source())
+    
+    def _build_processed_paper(self, full_text: str, figures_count: int, tables_count: int) -> ProcessedPaper:
+        """Extract structured content from a paper's text."""
+        # Case-fold once for every case-insensitive search below
+        text_lower = full_text.lower()
         
         # Extract sections
         sections = self._extract_sections(full_text)
         
         # Extract GitHub URLs
-        github_urls = self._extract_github_urls(full_text)
+        github_urls = self._extract_github_urls(full_text, text_lower)
         
         # Extract references
-        references = self._extract_references(full_text)
+        references = self._extract_references(full_text, sections)
         
         # Extract methodology keywords
         methodology = self._extract_methodology(sections.get('methodology', ''))
@@ -137,10 +370,14 @@ class PDFProcessor:
             
             # Check if line is a section header
             section_found = None
-            for section_name, pattern in self.section_patterns.items():
-                if pattern.search(line) and len(line) < 50:  # Likely a header
-                    section_found = section_name
-                    break
+            if len(line) < 50:  # Likely a header
+                names = self._section_re.findall(line.lower())
+                if names:
+                    # A line naming several sections counts as the highest-priority one
+                    section_found = min(
+                        (_SECTION_ALIASES[name] for name in names),
+                        key=_SECTION_PRIORITY.__getitem__
+                    )
             
             if section_found:
                 # Save previous section
@@ -158,25 +395,48 @@ class PDFProcessor:
         
         return sections
     
-    def _extract_github_urls(self, text: str) -> List[str]:
-        """Extract GitHub repository URLs."""
-        urls = self.github_pattern.findall(text)
-        return list(set(urls))  # Remove duplicates
+    def _extract_github_urls(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Extract GitHub repository URLs (``text_lower`` is ``text.lower()`` if already computed)."""
+        if text_lower is None:
+            text_lower = text.lower()
+        if len(text_lower) != len(text):
+            # Case folding changed offsets (rare non-ASCII); scan the original instead
+            return list(dict.fromkeys(self.github_pattern.findall(text)))
+        
+        # Anchor on the literal host with str.find and only run the URL regex
+        # where it occurs, instead of trying it at every offset of the paper
+        # Dict keys dedupe while keeping first-seen order (stable across runs)
+        urls: Dict[str, None] = {}
+        scanned_to = 0
+        index = text_lower.find(_GITHUB_HOST)
+        while index != -1:
+            for prefix in _GITHUB_URL_PREFIXES:
+                start = index - len(prefix)
+                if start >= scanned_to and text_lower.startswith(prefix, start):
+                    match = self.github_pattern.match(text, start)
+                    if match:
+                        urls[match.group()] = None
+                        scanned_to = match.end()
+                    break
+            index = text_lower.find(_GITHUB_HOST, max(index + 1, scanned_to))
+        return list(urls)
     
-    def _extract_references(self, text: str) -> List[str]:
-        """Extract paper references."""
+    def _extract_references(self, text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
+        """Extract paper references, reusing ``sections`` if already extracted."""
         references = []
+        if sections is None:
+            sections = self._extract_sections(text)
         
         # Look for reference section
         ref_section = None
-        for section_name, content in self._extract_sections(text).items():
+        for section_name, content in sections.items():
             if 'reference' in section_name.lower():
                 ref_section = content
                 break
         
         if ref_section:
             # Split by common reference patterns
-            ref_lines = re.split(r'\n(?=\[\d+\]|\d+\.)', ref_section)
+            ref_lines = _REF_SPLIT_RE.split(ref_section)
             references = [ref.strip() for ref in ref_lines if ref.strip()]
         
         return references[:50]  # Limit to first 50 references
@@ -186,23 +446,20 @@ class PDFProcessor:
         if not methodology_text:
             return []
         
-        # Common ML/AI methodology terms
-        method_keywords = [
-            'neural network', 'deep learning', 'machine learning', 'transformer',
-            'attention', 'convolution', 'lstm', 'gru', 'bert', 'gpt',
-            'reinforcement learning', 'supervised learning', 'unsupervised learning',
-            'classification', 'regression', 'clustering', 'optimization',
-            'gradient descent', 'backpropagation', 'fine-tuning', 'pre-training'
-        ]
-        
-        found_methods = []
         text_lower = methodology_text.lower()
+        if _METHOD_AUTOMATON is None:
+            return [keyword for keyword in METHOD_KEYWORDS if keyword in text_lower]
         
-        for keyword in method_keywords:
-            if keyword in text_lower:
-                found_methods.append(keyword)
-        
-        return found_methods
+        # One pass over the text matches every keyword at once
+        found = {keyword for _, keyword in _METHOD_AUTOMATON.iter(text_lower)}
+        return [keyword for keyword in METHOD_KEYWORDS if keyword in found]
+    
+    @staticmethod
+    def _has_finding_anchor(text_lower: str) -> bool:
+        """Whether the text contains any literal a metric pattern needs."""
+        if _FINDING_AUTOMATON is None:
+            return any(anchor in text_lower for anchor in FINDING_ANCHORS)
+        return next(_FINDING_AUTOMATON.iter(text_lower), None) is not None
     
     def _extract_key_findings(self, results_text: str) -> List[str]:
         """Extract key findings from results section."""
@@ -211,24 +468,43 @@ class PDFProcessor:
         
         findings = []
         
-        # Look for sentences with performance metrics
-        metric_patterns = [
-            r'accuracy of (\d+\.?\d*%?)',
-            r'f1[- ]score of (\d+\.?\d*)',
-            r'precision of (\d+\.?\d*%?)',
-            r'recall of (\d+\.?\d*%?)',
-            r'improved? by (\d+\.?\d*%?)',
-            r'outperform[s]? .* by (\d+\.?\d*%?)',
-            r'achieve[s]? (\d+\.?\d*%?) accuracy'
+        results_lower = results_text.lower()
+        if not self._has_finding_anchor(results_lower):
+            return []
+        
+        if len(results_lower) == len(results_text):
+            matches = self._metric_re.finditer(results_lower)
+        else:
+            matches = _METRIC_RE_ANY_CASE.finditer(results_text)
+        
+        # One scan over the results text for all metric patterns. Only spans
+        # are kept here; context is sliced (from the original, preserving its
+        # casing) just for the findings that make the cut
+        spans = [
+            (int(match.lastgroup[1:]), match.start(), match.end())
+            for match in matches
         ]
         
-        for pattern in metric_patterns:
-            matches = re.finditer(pattern, results_text, re.IGNORECASE)
-            for match in matches:
-                # Get surrounding context
-                start = max(0, match.start() - 100)
-                end = min(len(results_text), match.end() + 100)
-                context = results_text[start:end].strip()
-                findings.append(context)
+        # Report grouped by pattern, as the per-pattern passes did
+        for _, match_start, match_end in heapq.nsmallest(10, spans):  # Limit to top 10 findings
+            # Get surrounding context
+            start = max(0, match_start - 100)
+            end = min(len(results_text), match_end + 100)
+            findings.append(results_text[start:end].strip())
         
-        return findings[:10]  # Limit to top 10 findings
\ No newline at end of file
+        return findings
+
+
+def _extract_paper(source: Union[bytes, str]) -> ProcessedPaper:
+    """Parse a PDF and extract its structured content (runs in a parse worker)."""
+    full_text, figures_count, tables_count = _parse_pdf(source)
+    return PDFProcessor()._build_processed_paper(full_text, figures_count, tables_count)
+
+
+def _extract_paper_or_none(source: Union[bytes, str]) -> Optional[ProcessedPaper]:
+    """``_extract_paper`` for batch maps, where one failure must not sink the rest."""
+    try:
+        return _extract_paper(source)
+    except Exception as e:
+        logger.error(f"Error processing PDF: {e}")
+        return None
@@ -1,18 +1,31 @@
 """Scheduler for automated paper ingestion and processing."""
 
 import asyncio
+import atexit
+import threading
 from datetime import datetime, timedelta
 from typing import List, Optional
 from celery import Celery
 from celery.schedules import crontab
 import structlog
 
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    _new_event_loop = asyncio.new_event_loop
+
 from ..ingestion.arxiv_client import ArxivClient, ArxivPaper
-from ..processing.pdf_processor import PDFProcessor
-from ..github_integration.repo_analyzer import GitHubRepoAnalyzer
+from ..processing.pdf_processor import PDFProcessor, ProcessedPaper, shutdown_parse_pool
+from ..github_integration.repo_analyzer import GitHubRepoAnalyzer, close_github_session
 
 logger = structlog.get_logger()
 
+# Papers processed at once per batch (each downloads a PDF and hits GitHub)
+PAPER_CONCURRENCY = 16
+# Papers whose PDFs are downloaded and then parsed together in one pool map
+PARSE_BATCH_SIZE = 32
+
 
 class PaperIngestionScheduler:
     """Scheduler for automated paper discovery and processing."""
@@ -29,26 +42,53 @@ class PaperIngestionScheduler:
         self.github_analyzer = github_analyzer
         self.celery_app = celery_app
         
+        # One loop for every task run by this scheduler, so clients bound to it
+        # (e.g. the pooled GitHub session) survive between tasks
+        self._runner = asyncio.Runner(loop_factory=_new_event_loop)
+        self._runner_lock = threading.Lock()
+        atexit.register(self._shutdown)
+        
         # Register periodic tasks
         self._register_periodic_tasks()
     
+    def _run(self, coro):
+        """Run a coroutine to completion on the scheduler's persistent loop."""
+        with self._runner_lock:
+            return self._runner.run(coro)
+    
+    def _shutdown(self):
+        """Release pooled HTTP connections, then close the scheduler's loop."""
+        try:
+            self._run(self._close_clients())
+        except Exception as e:
+            logger.warning(f"Error closing pipeline clients: {e}")
+        finally:
+            self._runner.close()
+    
+    async def _close_clients(self):
+        """Close the HTTP sessions and parse workers held by the pipeline clients."""
+        await self.pdf_processor.close()
+        await self.arxiv_client.close()
+        await close_github_session()
+        shutdown_parse_pool()
+    
     def _register_periodic_tasks(self):
         """Register periodic tasks with Celery Beat."""
         
         @self.celery_app.task(name="daily_paper_ingestion")
         def daily_paper_ingestion():
             """Daily task to fetch and process new papers."""
-            return asyncio.run(self.process_daily_papers())
+            return self._run(self.process_daily_papers())
         
         @self.celery_app.task(name="weekly_paper_backfill")
         def weekly_paper_backfill():
             """Weekly task to backfill any missed papers."""
-            return asyncio.run(self.process_weekly_backfill())
+            return self._run(self.process_weekly_backfill())
         
         @self.celery_app.task(name="process_single_paper")
         def process_single_paper(arxiv_id: str):
             """Process a single paper by arXiv ID."""
-            return asyncio.run(self.process_paper_by_id(arxiv_id))
+            return self._run(self.process_paper_by_id(arxiv_id))
         
         # Schedule periodic tasks
         self.celery_app.conf.beat_schedule = {
@@ -77,15 +117,15 @@ class PaperIngestionScheduler:
                 'errors': []
             }
             
-            for paper in papers:
-                try:
-                    await self._process_paper(paper)
+            outcomes = await self._process_concurrently(papers, self._store_paper)
+            for paper, outcome in zip(papers, outcomes):
+                if isinstance(outcome, Exception):
+                    results['failed'] += 1
+                    results['errors'].append(f"{paper.arxiv_id}: {str(outcome)}")
+                    logger.error(f"Failed to process paper {paper.arxiv_id}: {outcome}")
+                else:
                     results['processed'] += 1
                     logger.info(f"Processed paper: {paper.arxiv_id}")
-                except Exception as e:
-                    results['failed'] += 1
-                    results['errors'].append(f"{paper.arxiv_id}: {str(e)}")
-                    logger.error(f"Failed to process paper {paper.arxiv_id}: {e}")
             
             logger.info(f"Daily ingestion completed: {results}")
             return results
@@ -110,23 +150,25 @@ class PaperIngestionScheduler:
                 'errors': []
             }
             
-            for paper in papers:
-                try:
-                    # Check if paper already exists (implement in service layer)
-                    is_new = await self._is_new_paper(paper.arxiv_id)
-                    
-                    await self._process_paper(paper)
-                    
-                    if is_new:
-                        results['new_papers'] += 1
-                    else:
-                        results['updated_papers'] += 1
-                        
-                    logger.info(f"Backfilled paper: {paper.arxiv_id}")
-                except Exception as e:
+            async def backfill(paper: ArxivPaper, processed_content: Optional[ProcessedPaper]) -> bool:
+                # Check if paper already exists (implement in service layer)
+                is_new = await self._is_new_paper(paper.arxiv_id)
+                await self._store_paper(paper, processed_content)
+                return is_new
+            
+            outcomes = await self._process_concurrently(papers, backfill)
+            for paper, outcome in zip(papers, outcomes):
+                if isinstance(outcome, Exception):
                     results['failed'] += 1
-                    results['errors'].append(f"{paper.arxiv_id}: {str(e)}")
-                    logger.error(f"Failed to backfill paper {paper.arxiv_id}: {e}")
+                    results['errors'].append(f"{paper.arxiv_id}: {str(outcome)}")
+                    logger.error(f"Failed to backfill paper {paper.arxiv_id}: {outcome}")
+                    continue
+                
+                if outcome:
+                    results['new_papers'] += 1
+                else:
+                    results['updated_papers'] += 1
+                logger.info(f"Backfilled paper: {paper.arxiv_id}")
             
             logger.info(f"Weekly backfill completed: {results}")
             return results
@@ -153,6 +195,30 @@ class PaperIngestionScheduler:
             logger.error(f"Failed to process paper {arxiv_id}: {e}")
             return {'error': str(e)}
     
+    async def _process_concurrently(self, papers: List[ArxivPaper], process) -> list:
+        """Run ``process(paper, processed_content)`` over papers.
+        
+        Papers go in batches of ``PARSE_BATCH_SIZE``: each batch's PDFs are
+        downloaded concurrently and parsed together in one pool map, then
+        ``process`` runs at most ``PAPER_CONCURRENCY`` at a time. Results (or
+        the raised exceptions) come back in input order.
+        """
+        semaphore = asyncio.Semaphore(PAPER_CONCURRENCY)
+        
+        async def bounded(paper: ArxivPaper, processed_content: Optional[ProcessedPaper]):
+            async with semaphore:
+                return await process(paper, processed_content)
+        
+        outcomes = []
+        for offset in range(0, len(papers), PARSE_BATCH_SIZE):
+            batch = papers[offset:offset + PARSE_BATCH_SIZE]
+            processed = await self.pdf_processor.process_pdfs([paper.pdf_url for paper in batch])
+            outcomes.extend(await asyncio.gather(
+                *(bounded(paper, content) for paper, content in zip(batch, processed)),
+                return_exceptions=True
+            ))
+        return outcomes
+    
     async def _process_paper(self, paper: ArxivPaper) -> None:
         """Process a single paper through the complete pipeline."""
         
@@ -163,6 +229,11 @@ class PaperIngestionScheduler:
                 paper.pdf_url
             )
         
+        await self._store_paper(paper, processed_content)
+    
+    async def _store_paper(self, paper: ArxivPaper, processed_content: Optional[ProcessedPaper]) -> None:
+        """Run the post-PDF pipeline steps for a paper whose PDF is already processed."""
+        
         # Step 2: Analyze GitHub repositories
         github_analyses = []
         if processed_content and processed_content.github_urls:
@@ -2,13 +2,105 @@
 """Test LiteLLM integration with AI Agent Framework."""
 
 import asyncio
+import contextlib
 import os
 import sys
-from datetime import datetime
+import time
 
-# Add paths
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../ai-service'))
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../backend'))
+import pytest
+
+# Add paths (once, even if the module is imported again)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+for _path in (_ROOT, os.path.join(_ROOT, 'ai-service'), os.path.join(_ROOT, 'backend')):
+    if _path not in sys.path:
+        sys.path.append(_path)
+
+# Read once, before any test overrides the environment
+LITELLM_API_KEY = os.getenv('LITELLM_API_KEY')
+LITELLM_BASE_URL = os.getenv('LITELLM_BASE_URL')
+HAS_REAL_LITELLM_KEY = bool(LITELLM_API_KEY) and LITELLM_API_KEY != 'test-key'
+
+
+# Set while an _env_overrides block is open
+_ENV_OVERRIDE_ACTIVE = False
+
+
+@contextlib.contextmanager
+def _env_overrides(overrides):
+    """Set environment variables for the block, then restore their previous values.
+    
+    ``None`` removes a variable. LLM settings are re-read on entry and exit.
+    The environment is process-wide, so blocks must not overlap (e.g. across
+    coroutines running under one gather); an overlapping block raises.
+    """
+    global _ENV_OVERRIDE_ACTIVE
+    from backend.core.llm_config import reload_llm_settings
+    
+    if _ENV_OVERRIDE_ACTIVE:
+        raise RuntimeError("environment overrides must not overlap; run these tests sequentially")
+    
+    previous = {key: os.environ.get(key) for key in overrides}
+    
+    def apply(values):
+        for key, value in values.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        reload_llm_settings()
+    
+    _ENV_OVERRIDE_ACTIVE = True
+    try:
+        apply(overrides)
+        yield
+    finally:
+        apply(previous)
+        _ENV_OVERRIDE_ACTIVE = False
+
+
+# Model name formats every LiteLLM configuration should accept
+LITELLM_TEST_MODELS = (
+    "gpt-3.5-turbo",
+    "gpt-4",
+    "claude-3-sonnet-20240229",
+    "llama-2-7b-chat",
+    "mistral-7b-instruct"
+)
+
+
+# (label, environment overrides, probe every test model) per provider setup
+PROVIDER_CONFIGURATIONS = (
+    ("Standard OpenAI", {'USE_LITELLM': 'false', 'OPENAI_API_KEY': 'test-key'}, False),
+    ("LiteLLM", {
+        'USE_LITELLM': 'true',
+        'LITELLM_API_KEY': 'test-litellm-key',
+        'LITELLM_BASE_URL': 'https://api.litellm.ai/v1'
+    }, True),
+    ("LiteLLM (environment base URL)", {'USE_LITELLM': 'true', 'LITELLM_API_KEY': 'test-litellm-key'}, True)
+)
+
+
+def _check_models(get_llm_client):
+    """Build a client for each test model under the current configuration."""
+    for model in LITELLM_TEST_MODELS:
+        try:
+            get_llm_client(model)
+            print(f"✅ Model {model} configuration successful")
+        except Exception as e:
+            print(f"⚠️  Model {model} configuration warning: {e}")
+
+
+@pytest.mark.parametrize("model", LITELLM_TEST_MODELS)
+def test_model_configuration(model):
+    """Each test model gets a client under the LiteLLM configuration (pytest only)."""
+    from backend.core.llm_config import get_llm_client
+    
+    with _env_overrides({
+        'USE_LITELLM': 'true',
+        'LITELLM_API_KEY': 'test-litellm-key',
+        'LITELLM_BASE_URL': 'https://api.litellm.ai/v1'
+    }):
+        assert get_llm_client(model) is not None
 
 
 async def test_litellm_configuration():
@@ -16,37 +108,16 @@ async def test_litellm_configuration():
     print("🔧 Testing LiteLLM Configuration...")
     
     try:
-        from core.llm_config import get_llm_client
-        
-        # Test standard OpenAI configuration
-        os.environ['USE_LITELLM'] = 'false'
-        os.environ['OPENAI_API_KEY'] = 'test-key'
-        
-        llm = get_llm_client("gpt-3.5-turbo")
-        print("✅ Standard OpenAI configuration works")
-        
-        # Test LiteLLM configuration
-        os.environ['USE_LITELLM'] = 'true'
-        os.environ['LITELLM_API_KEY'] = 'test-litellm-key'
-        os.environ['LITELLM_BASE_URL'] = 'https://api.litellm.ai/v1'
+        from backend.core.llm_config import get_llm_client
         
-        llm_lite = get_llm_client("gpt-3.5-turbo")
-        print("✅ LiteLLM configuration works")
-        
-        # Test different model types
-        models_to_test = [
-            "gpt-3.5-turbo",
-            "gpt-4",
-            "claude-3-sonnet-20240229",
-            "llama-2-7b-chat"
-        ]
-        
-        for model in models_to_test:
-            try:
-                llm_model = get_llm_client(model)
-                print(f"✅ Model {model} configuration successful")
-            except Exception as e:
-                print(f"⚠️  Model {model} configuration warning: {e}")
+        # Switch between the providers, probing every model format under LiteLLM
+        for label, overrides, check_models in PROVIDER_CONFIGURATIONS:
+            with _env_overrides(overrides):
+                get_llm_client("gpt-3.5-turbo")
+                print(f"✅ {label} configuration works")
+                
+                if check_models:
+                    _check_models(get_llm_client)
         
         return True
         
@@ -63,47 +134,58 @@ async def test_agent_with_litellm():
         from agents.paper_agent import PaperAgentFactory
         
         # Set LiteLLM environment
-        os.environ['USE_LITELLM'] = 'true'
-        os.environ['LITELLM_API_KEY'] = os.getenv('LITELLM_API_KEY', 'test-key')
-        os.environ['LITELLM_BASE_URL'] = os.getenv('LITELLM_BASE_URL', 'https://api.litellm.ai/v1')
-        
-        # Sample paper data
-        paper_data = {
-            "id": "litellm_test",
-            "title": "Testing LiteLLM Integration",
-            "abstract": "This paper tests the integration of LiteLLM with our AI agent framework.",
-            "authors": ["Test Author"],
-            "categories": ["cs.AI"],
-            "methodology": ["litellm", "testing"],
-            "github_repos": [],
-            "key_findings": ["LiteLLM integration successful"]
-        }
-        
-        # Create agent with different models
-        models_to_test = ["gpt-3.5-turbo", "gpt-4"]
-        
-        for model in models_to_test:
-            try:
+        with _env_overrides({
+            'USE_LITELLM': 'true',
+            'LITELLM_API_KEY': LITELLM_API_KEY or 'test-key',
+            'LITELLM_BASE_URL': LITELLM_BASE_URL or 'https://api.litellm.ai/v1'
+        }):
+            # Sample paper data
+            paper_data = {
+                "id": "litellm_test",
+                "title": "Testing LiteLLM Integration",
+                "abstract": "This paper tests the integration of LiteLLM with our AI agent framework.",
+                "authors": ["Test Author"],
+                "categories": ["cs.AI"],
+                "methodology": ["litellm", "testing"],
+                "github_repos": [],
+                "key_findings": ["LiteLLM integration successful"]
+            }
+            
+            # Create agent with different models
+            models_to_test = ["gpt-3.5-turbo", "gpt-4"]
+            
+            async def _probe(model):
+                agent = response = None
+                try:
+                    agent = PaperAgentFactory.create_agent(
+                        paper_data=paper_data,
+                        model_name=model,
+                        temperature=0.1
+                    )
+                    # Test query (will fail without real API key but validates structure)
+                    if HAS_REAL_LITELLM_KEY:
+                        response = (await agent.query("What is this paper about?"))['response']
+                    return model, agent is not None, response, None
+                except Exception as e:
+                    return model, agent is not None, response, e
+            
+            # Query all models at once, then report in order
+            outcomes = await asyncio.gather(*(_probe(model) for model in models_to_test))
+            
+            for model, created, response, error in outcomes:
                 print(f"   Testing with model: {model}")
-                agent = PaperAgentFactory.create_agent(
-                    paper_data=paper_data,
-                    model_name=model,
-                    temperature=0.1
-                )
-                print(f"✅ Agent created successfully with {model}")
-                
-                # Test query (will fail without real API key but validates structure)
-                if os.getenv('LITELLM_API_KEY') and os.getenv('LITELLM_API_KEY') != 'test-key':
-                    response = await agent.query("What is this paper about?")
-                    print(f"✅ Agent query successful: {response['response'][:50]}...")
-                else:
-                    print("⚠️  Skipping query test (no real API key)")
+                if created:
+                    print(f"✅ Agent created successfully with {model}")
+                    if response is not None:
+                        print(f"✅ Agent query successful: {response[:50]}...")
+                    elif error is None:
+                        print("⚠️  Skipping query test (no real API key)")
                 
-            except Exception as e:
-                if 'API' in str(e) or 'key' in str(e) or 'auth' in str(e):
-                    print(f"✅ Agent structure OK for {model} (API key needed for full test)")
-                else:
-                    print(f"❌ Agent creation failed for {model}: {e}")
+                if error is not None:
+                    if 'API' in str(error) or 'key' in str(error) or 'auth' in str(error):
+                        print(f"✅ Agent structure OK for {model} (API key needed for full test)")
+                    else:
+                        print(f"❌ Agent creation failed for {model}: {error}")
         
         return True
         
@@ -120,39 +202,41 @@ async def test_summarizer_with_litellm():
         from summarization.paper_summarizer import PaperSummarizer, SummaryRequest
         
         # Set LiteLLM environment
-        os.environ['USE_LITELLM'] = 'true'
-        
-        # Create summarizer
-        summarizer = PaperSummarizer("gpt-3.5-turbo")
-        print("✅ Summarizer created with LiteLLM configuration")
-        
-        # Test summary request structure
-        paper_content = {
-            "id": "test_paper",
-            "title": "LiteLLM Integration Test",
-            "abstract": "Testing LiteLLM integration with summarization service.",
-            "full_text": "This is a test paper for validating LiteLLM integration.",
-            "methodology": ["litellm", "integration", "testing"]
-        }
-        
-        request = SummaryRequest(
-            text="",
-            summary_type="concise",
-            target_audience="intermediate",
-            max_length=150
-        )
-        
-        print("✅ Summary request structure validated")
-        
-        # Test actual summarization (if API key available)
-        if os.getenv('LITELLM_API_KEY') and os.getenv('LITELLM_API_KEY') != 'test-key':
-            try:
-                result = await summarizer.summarize_paper(paper_content, request)
-                print(f"✅ Summarization successful: {len(result['summary'].split())} words")
-            except Exception as e:
-                print(f"⚠️  Summarization test skipped: {e}")
-        else:
-            print("⚠️  Skipping summarization test (no real API key)")
+        with _env_overrides({
+            'USE_LITELLM': 'true',
+            'LITELLM_API_KEY': LITELLM_API_KEY or 'test-key'
+        }):
+            # Create summarizer
+            summarizer = PaperSummarizer("gpt-3.5-turbo")
+            print("✅ Summarizer created with LiteLLM configuration")
+            
+            # Test summary request structure
+            paper_content = {
+                "id": "test_paper",
+                "title": "LiteLLM Integration Test",
+                "abstract": "Testing LiteLLM integration with summarization service.",
+                "full_text": "This is a test paper for validating LiteLLM integration.",
+                "methodology": ["litellm", "integration", "testing"]
+            }
+            
+            request = SummaryRequest(
+                text="",
+                summary_type="concise",
+                target_audience="intermediate",
+                max_length=150
+            )
+            
+            print("✅ Summary request structure validated")
+            
+            # Test actual summarization (if API key available)
+            if HAS_REAL_LITELLM_KEY:
+                try:
+                    result = await summarizer.summarize_paper(paper_content, request)
+                    print(f"✅ Summarization successful: {len(result['summary'].split())} words")
+                except Exception as e:
+                    print(f"⚠️  Summarization test skipped: {e}")
+            else:
+                print("⚠️  Skipping summarization test (no real API key)")
         
         return True
         
@@ -161,68 +245,31 @@ async def test_summarizer_with_litellm():
         return False
 
 
-async def test_environment_switching():
-    """Test switching between LiteLLM and standard providers."""
-    print("\n🔄 Testing Environment Switching...")
-    
-    try:
-        from core.llm_config import get_llm_client
-        
-        # Test switching to standard OpenAI
-        os.environ['USE_LITELLM'] = 'false'
-        os.environ['OPENAI_API_KEY'] = 'test-openai-key'
-        
-        llm_openai = get_llm_client("gpt-3.5-turbo")
-        print("✅ Switched to standard OpenAI")
-        
-        # Test switching to LiteLLM
-        os.environ['USE_LITELLM'] = 'true'
-        os.environ['LITELLM_API_KEY'] = 'test-litellm-key'
-        
-        llm_litellm = get_llm_client("gpt-3.5-turbo")
-        print("✅ Switched to LiteLLM")
-        
-        # Test with different models
-        os.environ['USE_LITELLM'] = 'true'
-        
-        # Test various model formats
-        test_models = [
-            "gpt-3.5-turbo",
-            "gpt-4",
-            "claude-3-sonnet-20240229",
-            "llama-2-7b-chat",
-            "mistral-7b-instruct"
-        ]
-        
-        for model in test_models:
-            try:
-                llm = get_llm_client(model)
-                print(f"✅ Model {model} configuration successful")
-            except Exception as e:
-                print(f"⚠️  Model {model}: {e}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Environment switching test failed: {e}")
-        return False
-
-
 async def main():
     """Run all LiteLLM integration tests."""
     print("🚀 Starting LiteLLM Integration Tests")
     print("=" * 50)
     
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
+    
+    # Warm the shared connection pool while the first clients are being built
+    prewarm = None
+    try:
+        from backend.core.llm_config import prewarm_llm_connection
+        prewarm = asyncio.create_task(prewarm_llm_connection(
+            LITELLM_BASE_URL or 'https://api.litellm.ai/v1'
+        ))
+    except ImportError:
+        pass
     
     # Check for LiteLLM configuration
-    if os.getenv('LITELLM_API_KEY'):
+    if LITELLM_API_KEY:
         print(f"✅ LiteLLM API Key configured")
     else:
         print("⚠️  LITELLM_API_KEY not set - using test keys")
     
-    if os.getenv('LITELLM_BASE_URL'):
-        print(f"✅ LiteLLM Base URL: {os.getenv('LITELLM_BASE_URL')}")
+    if LITELLM_BASE_URL:
+        print(f"✅ LiteLLM Base URL: {LITELLM_BASE_URL}")
     else:
         print("⚠️  LITELLM_BASE_URL not set - using default")
     
@@ -232,8 +279,7 @@ async def main():
     tests = [
         ("LiteLLM Configuration", test_litellm_configuration()),
         ("Agent with LiteLLM", test_agent_with_litellm()),
-        ("Summarizer with LiteLLM", test_summarizer_with_litellm()),
-        ("Environment Switching", test_environment_switching())
+        ("Summarizer with LiteLLM", test_summarizer_with_litellm())
     ]
     
     results = []
@@ -245,6 +291,15 @@ async def main():
             print(f"❌ {test_name} test crashed: {e}")
             results.append((test_name, False))
     
+    # Release the pooled connections the tests shared
+    if prewarm is not None:
+        await prewarm
+    try:
+        from backend.core.llm_config import close_llm_http_client
+        await close_llm_http_client()
+    except ImportError:
+        pass
+    
     # Print summary
     print("\n" + "=" * 50)
     print("📊 LiteLLM Integration Test Results")
@@ -257,8 +312,7 @@ async def main():
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"{status} {test_name}")
     
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
     
     print(f"\nTests completed in {duration:.2f} seconds")
     print(f"Results: {passed}/{total} tests passed")
@@ -5,14 +5,22 @@ Tests all Phase 3 components and their integration
 """
 
 import asyncio
+import contextvars
+import functools
+import importlib
+import io
 import sys
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import List, Dict, Any
 
-# Add project paths
-sys.path.append('/home/mohit/workspace/Project_research/backend')
-sys.path.append('/home/mohit/workspace/Project_research/ai-service')
+# Add project paths (once, relative to this checkout)
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+for _path in (os.path.join(_ROOT, 'backend'), os.path.join(_ROOT, 'ai-service')):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 # Test data
 SAMPLE_PAPERS = [
@@ -104,6 +112,62 @@ SAMPLE_USER_INTERACTIONS = [
     {"paper": SAMPLE_PAPERS[3], "action": "rate_positive", "timestamp": "2024-01-05"}
 ]
 
+# Year groups for the topic evolution test (read-only, built once)
+SAMPLE_PAPERS_BY_YEAR = MappingProxyType({
+    2017: (SAMPLE_PAPERS[0],),
+    2018: (SAMPLE_PAPERS[1],),
+    2019: (SAMPLE_PAPERS[3], SAMPLE_PAPERS[5]),
+    2020: (SAMPLE_PAPERS[2],)
+})
+
+# Imported up front so the parallel tests do not contend on the import lock
+PRELOAD_MODULES = [
+    "clustering.semantic_clusterer",
+    "clustering.topic_modeler",
+    "genealogy.citation_analyzer",
+    "discovery.recommendation_engine",
+    "discovery.trend_analyzer",
+    "services.intelligent_organization_service",
+]
+
+def _preload_modules():
+    """Import the modules under test once; failures resurface in the test that needs them"""
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+
+# Buffer receiving the running test's output (None: write straight through)
+_test_output = contextvars.ContextVar("_test_output", default=None)
+
+class _TestStream:
+    """Route writes to the running test's buffer, so parallel tests don't interleave"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        return (_test_output.get() or self.stream).write(text)
+    
+    def flush(self):
+        (_test_output.get() or self.stream).flush()
+
+def _run_buffered(run):
+    """Call run() with its stdout/stderr captured; returns (result, output)"""
+    buffer = io.StringIO()
+    token = _test_output.set(buffer)
+    try:
+        return run(), buffer.getvalue()
+    finally:
+        _test_output.reset(token)
+
+@functools.lru_cache(maxsize=1)
+def _sample_embeddings():
+    """Embed SAMPLE_PAPERS once for every test that needs the matrix"""
+    from clustering.semantic_clusterer import SemanticClusterer
+    return SemanticClusterer().embed(SAMPLE_PAPERS)
+
 def test_semantic_clustering():
     """Test semantic clustering functionality"""
     print("🧪 Testing Semantic Clustering...")
@@ -114,7 +178,9 @@ def test_semantic_clustering():
         clusterer = SemanticClusterer()
         
         # Test clustering
-        result = clusterer.cluster_papers(SAMPLE_PAPERS, method="kmeans")
+        result = clusterer.cluster_papers(
+            SAMPLE_PAPERS, method="kmeans", embeddings=_sample_embeddings()
+        )
         
         assert "clusters" in result
         assert "topics" in result
@@ -171,14 +237,7 @@ def test_topic_modeling():
         print(f"   ✅ Predicted topics for new papers")
         
         # Test topic evolution
-        papers_by_year = {
-            2017: [SAMPLE_PAPERS[0]],
-            2018: [SAMPLE_PAPERS[1]],
-            2019: [SAMPLE_PAPERS[3], SAMPLE_PAPERS[5]],
-            2020: [SAMPLE_PAPERS[2]]
-        }
-        
-        evolution = modeler.get_topic_evolution(papers_by_year)
+        evolution = modeler.get_topic_evolution(SAMPLE_PAPERS_BY_YEAR)
         
         assert "evolution" in evolution
         assert "trend_analysis" in evolution
@@ -336,31 +395,23 @@ async def test_service_integration():
     print("🧪 Testing Service Integration...")
     
     try:
+        # Mock paper objects expose the sample dicts as attributes; build them once
+        class MockPaper:
+            def __init__(self, data):
+                self.__dict__ = data
+        
+        mock_papers = [MockPaper(paper) for paper in SAMPLE_PAPERS]
+        mock_papers_by_id = {paper.id: paper for paper in mock_papers}
+        
         # Mock repository for testing
         class MockPaperRepository:
             async def get_by_id(self, paper_id: str):
-                for paper in SAMPLE_PAPERS:
-                    if paper["id"] == paper_id:
-                        # Create mock paper object
-                        class MockPaper:
-                            def __init__(self, data):
-                                for key, value in data.items():
-                                    setattr(self, key, value)
-                                self.__dict__ = data
-                        return MockPaper(paper)
-                return None
+                return mock_papers_by_id.get(paper_id)
             
             async def get_all(self, limit: int = 100):
-                class MockPaper:
-                    def __init__(self, data):
-                        for key, value in data.items():
-                            setattr(self, key, value)
-                        self.__dict__ = data
-                
-                return [MockPaper(paper) for paper in SAMPLE_PAPERS[:limit]]
+                return mock_papers[:limit]
         
         # Import and test service
-        sys.path.append('/home/mohit/workspace/Project_research/backend')
         from services.intelligent_organization_service import IntelligentOrganizationService
         
         mock_repo = MockPaperRepository()
@@ -427,25 +478,57 @@ def main():
     print("🚀 Starting Phase 3: Intelligent Organization Integration Tests")
     print("=" * 60)
     
+    _preload_modules()
+    
     tests = [
         ("Semantic Clustering", test_semantic_clustering),
         ("Topic Modeling", test_topic_modeling),
         ("Citation Analysis", test_citation_analysis),
         ("Recommendation Engine", test_recommendation_engine),
         ("Trend Analysis", test_trend_analysis),
-        ("Service Integration", lambda: asyncio.run(test_service_integration()))
+        ("Service Integration", test_service_integration)
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
-        print(f"\n📋 Running {test_name} Tests...")
+    def run_test(test_name, run):
         try:
-            success = test_func()
-            results.append((test_name, success))
+            return test_name, run()
         except Exception as e:
             print(f"   ❌ {test_name} test failed with exception: {e}")
-            results.append((test_name, False))
+            return test_name, False
+    
+    sync_tests = [(name, func) for name, func in tests if not asyncio.iscoroutinefunction(func)]
+    async_tests = [(name, func) for name, func in tests if asyncio.iscoroutinefunction(func)]
+    outcomes = {}
+    
+    # The tests share no mutable state: submit the sync ones to the pool, run
+    # the async ones on one event loop meanwhile, then report in order. Each
+    # test's output is buffered so the parallel runs don't interleave.
+    sys.stdout, sys.stderr = _TestStream(sys.stdout), _TestStream(sys.stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(sync_tests)) as executor, asyncio.Runner() as runner:
+            futures = [
+                executor.submit(_run_buffered, functools.partial(run_test, test_name, test_func))
+                for test_name, test_func in sync_tests
+            ]
+            
+            for test_name, test_func in async_tests:
+                # The runner keeps its own context unless given the caller's
+                outcomes[test_name] = _run_buffered(lambda: run_test(
+                    test_name,
+                    lambda: runner.run(test_func(), context=contextvars.copy_context())
+                ))
+            
+            for (test_name, _), future in zip(sync_tests, futures):
+                outcomes[test_name] = future.result()
+    finally:
+        sys.stdout, sys.stderr = sys.stdout.stream, sys.stderr.stream
+    
+    results = []
+    for test_name, _ in tests:
+        outcome, output = outcomes[test_name]
+        print(f"\n📋 Running {test_name} Tests...")
+        print(output, end="")
+        results.append(outcome)
     
     # Summary
     print("\n" + "=" * 60)
@@ -4,14 +4,43 @@ Phase 3: Intelligent Organization - Structure Validation
 Validates Phase 3 implementation structure and components
 """
 
+import ast
 import os
+import re
 import sys
 import importlib.util
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict
+
+@lru_cache(maxsize=None)
+def _dir_entries(dirpath: str) -> Dict[str, bool]:
+    """Map each name in a directory to whether it is a directory (one scandir per directory)"""
+    try:
+        with os.scandir(dirpath) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+def path_exists(path: str) -> bool:
+    """Existence check answered from the cached parent listing"""
+    parent, name = os.path.split(path)
+    return name in _dir_entries(parent)
+
+def is_directory(path: str) -> bool:
+    """Directory check answered from the cached parent listing"""
+    parent, name = os.path.split(path)
+    return _dir_entries(parent).get(name, False)
+
+@lru_cache(maxsize=64)
+def read_text(filepath: str) -> str:
+    """Read a file once; the syntax, import and class checks share the contents"""
+    return Path(filepath).read_text()
 
 def check_file_exists(filepath: str, description: str) -> bool:
     """Check if a file exists and report result"""
-    if os.path.exists(filepath):
+    if path_exists(filepath):
         print(f"   ✅ {description}")
         return True
     else:
@@ -21,8 +50,8 @@ def check_file_exists(filepath: str, description: str) -> bool:
 def check_python_syntax(filepath: str, description: str) -> bool:
     """Check if Python file has valid syntax"""
     try:
-        with open(filepath, 'r') as f:
-            compile(f.read(), filepath, 'exec')
+        # AST only: a syntax check needs no bytecode
+        ast.parse(read_text(filepath), filename=filepath)
         print(f"   ✅ {description} - Valid syntax")
         return True
     except SyntaxError as e:
@@ -32,28 +61,6 @@ def check_python_syntax(filepath: str, description: str) -> bool:
         print(f"   ❌ {description} - Error: {e}")
         return False
 
-def check_imports(filepath: str, description: str) -> bool:
-    """Check if Python file imports are valid (basic check)"""
-    try:
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
-        # Basic import validation
-        lines = content.split('\n')
-        import_lines = [line.strip() for line in lines if line.strip().startswith(('import ', 'from '))]
-        
-        # Check for obvious issues
-        for line in import_lines:
-            if 'import' not in line:
-                continue
-            # Basic validation passed
-        
-        print(f"   ✅ {description} - Import structure valid")
-        return True
-    except Exception as e:
-        print(f"   ❌ {description} - Import check failed: {e}")
-        return False
-
 def validate_phase3_structure():
     """Validate Phase 3 file structure"""
     print("🧪 Validating Phase 3 File Structure...")
@@ -111,10 +118,8 @@ def validate_python_syntax():
     
     results = []
     for filepath, description in python_files:
-        if os.path.exists(filepath):
-            syntax_ok = check_python_syntax(filepath, description)
-            import_ok = check_imports(filepath, f"{description} imports")
-            results.append((description, syntax_ok and import_ok))
+        if path_exists(filepath):
+            results.append((description, check_python_syntax(filepath, description)))
         else:
             results.append((description, False))
     
@@ -129,10 +134,9 @@ def validate_api_integration():
     
     results = []
     
-    if os.path.exists(router_file):
+    if path_exists(router_file):
         try:
-            with open(router_file, 'r') as f:
-                content = f.read()
+            content = read_text(router_file)
             
             # Check if intelligent_organization is imported and included
             if "intelligent_organization" in content:
@@ -158,6 +162,10 @@ def validate_api_integration():
     
     return results
 
+# Phase 3 dependencies; the names never overlap, so one alternation finds each of them
+PHASE3_DEPS = ["scikit-learn", "numpy", "networkx", "scipy"]
+PHASE3_DEPS_RE = re.compile("|".join(map(re.escape, PHASE3_DEPS)))
+
 def validate_requirements():
     """Validate requirements are updated"""
     print("\n🧪 Validating Requirements...")
@@ -167,16 +175,15 @@ def validate_requirements():
     
     results = []
     
-    if os.path.exists(req_file):
+    if path_exists(req_file):
         try:
-            with open(req_file, 'r') as f:
-                content = f.read()
+            content = read_text(req_file)
             
-            # Check for Phase 3 dependencies
-            phase3_deps = ["scikit-learn", "numpy", "networkx", "scipy"]
+            # Check for Phase 3 dependencies in a single scan
+            found = set(PHASE3_DEPS_RE.findall(content))
             
-            for dep in phase3_deps:
-                if dep in content:
+            for dep in PHASE3_DEPS:
+                if dep in found:
                     print(f"   ✅ {dep} dependency found")
                     results.append((f"{dep} dependency", True))
                 else:
@@ -207,7 +214,7 @@ def validate_directory_structure():
     
     results = []
     for dirpath, description in directories:
-        if os.path.exists(dirpath) and os.path.isdir(dirpath):
+        if is_directory(dirpath):
             print(f"   ✅ {description}")
             results.append((description, True))
         else:
@@ -216,6 +223,12 @@ def validate_directory_structure():
     
     return results
 
+@lru_cache(maxsize=64)
+def defined_classes(filepath: str) -> frozenset:
+    """Names of all classes defined in a file (parsed once, comments and strings ignored)"""
+    tree = ast.parse(read_text(filepath), filename=filepath)
+    return frozenset(node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
+
 def check_class_definitions():
     """Check if main classes are properly defined"""
     print("\n🧪 Validating Class Definitions...")
@@ -233,12 +246,9 @@ def check_class_definitions():
     
     results = []
     for filepath, class_name, description in class_checks:
-        if os.path.exists(filepath):
+        if path_exists(filepath):
             try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                
-                if f"class {class_name}" in content:
+                if class_name in defined_classes(filepath):
                     print(f"   ✅ {description}")
                     results.append((description, True))
                 else:
@@ -254,6 +264,15 @@ def check_class_definitions():
     
     return results
 
+# Summary categories, matched in order against the lowercased result name
+RESULT_CATEGORIES = (
+    ("Syntax", ("syntax", "import")),
+    ("API", ("api", "router")),
+    ("Dependencies", ("dependency", "requirements")),
+    ("Directories", ("directory",)),
+    ("Classes", ("class",)),
+)
+
 def main():
     """Run all Phase 3 structure validation tests"""
     print("🚀 Phase 3: Intelligent Organization - Structure Validation")
@@ -262,39 +281,38 @@ def main():
     all_results = []
     
     # Run validation tests
-    all_results.extend(validate_phase3_structure())
-    all_results.extend(validate_python_syntax())
-    all_results.extend(validate_api_integration())
-    all_results.extend(validate_requirements())
-    all_results.extend(validate_directory_structure())
-    all_results.extend(check_class_definitions())
+    for validate in (
+        validate_phase3_structure,
+        validate_python_syntax,
+        validate_api_integration,
+        validate_requirements,
+        validate_directory_structure,
+        check_class_definitions
+    ):
+        all_results.extend(validate())
+        # Show each section as soon as it completes, even when piped
+        sys.stdout.flush()
     
     # Summary
     print("\n" + "=" * 65)
     print("📊 PHASE 3 STRUCTURE VALIDATION SUMMARY")
     print("=" * 65)
     
-    passed = sum(1 for _, success in all_results if success)
-    total = len(all_results)
-    
-    # Group results by category
+    # Group results by category and count passes in a single pass
     categories = {}
+    outcomes = Counter()
     for name, success in all_results:
-        category = "Structure"
-        if "syntax" in name.lower() or "import" in name.lower():
-            category = "Syntax"
-        elif "api" in name.lower() or "router" in name.lower():
-            category = "API"
-        elif "dependency" in name.lower() or "requirements" in name.lower():
-            category = "Dependencies"
-        elif "directory" in name.lower():
-            category = "Directories"
-        elif "class" in name.lower():
-            category = "Classes"
-        
-        if category not in categories:
-            categories[category] = []
-        categories[category].append((name, success))
+        lowered = name.lower()
+        category = next(
+            (category for category, keywords in RESULT_CATEGORIES
+             if any(keyword in lowered for keyword in keywords)),
+            "Structure"
+        )
+        categories.setdefault(category, []).append((name, success))
+        outcomes[bool(success)] += 1
+    
+    passed = outcomes[True]
+    total = len(all_results)
     
     for category, items in categories.items():
         print(f"\n{category}:")
@@ -2,16 +2,83 @@
 """Test script for data pipeline functionality."""
 
 import asyncio
+import contextvars
+import hashlib
+import inspect
+import io
+import pickle
 import sys
 import os
 from datetime import datetime
+from pathlib import Path
 
 # Add data pipeline to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'data-pipeline'))
 
 from data_pipeline.ingestion.arxiv_client import ArxivClient
-from data_pipeline.processing.pdf_processor import PDFProcessor
-from data_pipeline.github_integration.repo_analyzer import GitHubRepoAnalyzer
+from data_pipeline.processing.pdf_processor import PDFProcessor, shutdown_parse_pool
+from data_pipeline.github_integration.repo_analyzer import GitHubRepoAnalyzer, close_github_session
+
+
+# Results of slow network fetches, keyed by URL and the source of the code
+# that produced them; delete the directory to refetch
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "pipeline"
+
+
+async def cached_fetch(kind, url, fetch, producer):
+    """Return ``await fetch(url)``, served from the on-disk cache when warm.
+    
+    The key includes a hash of ``producer``'s module source, so any change to
+    the processing code invalidates the entry and the code runs again.
+    """
+    key = hashlib.sha1(url.encode())
+    key.update(Path(inspect.getsourcefile(producer)).read_bytes())
+    cache_file = CACHE_DIR / f"{kind}-{key.hexdigest()}.pickle"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # missing, truncated or stale entry: fetch again
+    
+    result = await fetch(url)
+    if result is not None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(pickle.dumps(result))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # caching is best effort
+    return result
+
+
+# Buffer receiving the current test's prints (None: write straight to stdout)
+_test_output: contextvars.ContextVar = contextvars.ContextVar("_test_output", default=None)
+
+
+class _TestStdout:
+    """Route writes to the running test's buffer, so overlapping tests don't interleave."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        return (_test_output.get() or self._stream).write(text)
+    
+    def flush(self):
+        (_test_output.get() or self._stream).flush()
+
+
+async def _run_buffered(test_func):
+    """Run a test with its output captured; returns (result or exception, output)."""
+    buffer = io.StringIO()
+    token = _test_output.set(buffer)
+    try:
+        return await test_func(), buffer.getvalue()
+    except Exception as e:
+        return e, buffer.getvalue()
+    finally:
+        _test_output.reset(token)
 
 
 async def test_arxiv_client():
@@ -40,6 +107,8 @@ async def test_arxiv_client():
     except Exception as e:
         print(f"❌ arXiv client test failed: {e}")
         return False
+    finally:
+        await client.close()
 
 
 async def test_pdf_processor():
@@ -54,7 +123,7 @@ async def test_pdf_processor():
         test_pdf_url = "https://arxiv.org/pdf/1706.03762.pdf"  # Attention Is All You Need
         
         print(f"   Processing PDF: {test_pdf_url}")
-        processed = await processor.download_and_process_pdf(test_pdf_url)
+        processed = await cached_fetch("pdf", test_pdf_url, processor.download_and_process_pdf, PDFProcessor)
         
         if processed:
             print(f"✅ PDF processed successfully")
@@ -72,6 +141,8 @@ async def test_pdf_processor():
     except Exception as e:
         print(f"❌ PDF processor test failed: {e}")
         return False
+    finally:
+        await processor.close()
 
 
 async def test_github_analyzer():
@@ -86,7 +157,7 @@ async def test_github_analyzer():
         test_repo_url = "https://github.com/huggingface/transformers"
         
         print(f"   Analyzing repository: {test_repo_url}")
-        analysis = await analyzer.analyze_repository(test_repo_url)
+        analysis = await cached_fetch("repo", test_repo_url, analyzer.analyze_repository, GitHubRepoAnalyzer)
         
         if analysis:
             print(f"✅ Repository analyzed successfully")
@@ -111,9 +182,10 @@ async def test_integration():
     """Test integration of all components."""
     print("\n🔗 Testing Integration...")
     
+    client = ArxivClient(max_results=1, delay_seconds=1.0)
+    processor = PDFProcessor()
     try:
         # Fetch a paper
-        client = ArxivClient(max_results=1, delay_seconds=1.0)
         papers = await client.search_papers("BERT language model", max_results=1)
         
         if not papers:
@@ -124,7 +196,6 @@ async def test_integration():
         print(f"   Using paper: {paper.title[:50]}...")
         
         # Process PDF
-        processor = PDFProcessor()
         processed = await processor.download_and_process_pdf(paper.pdf_url)
         
         if processed and processed.github_urls:
@@ -145,6 +216,9 @@ async def test_integration():
     except Exception as e:
         print(f"❌ Integration test failed: {e}")
         return False
+    finally:
+        await client.close()
+        await processor.close()
 
 
 async def main():
@@ -156,20 +230,39 @@ async def main():
     
     # Run tests
     tests = [
-        ("arXiv Client", test_arxiv_client()),
-        ("PDF Processor", test_pdf_processor()),
-        ("GitHub Analyzer", test_github_analyzer()),
-        ("Integration", test_integration())
+        ("arXiv Client", test_arxiv_client),
+        ("PDF Processor", test_pdf_processor),
+        ("GitHub Analyzer", test_github_analyzer),
+        ("Integration", test_integration)
     ]
     
+    async def run_in_order(test_funcs):
+        return [await _run_buffered(test_func) for test_func in test_funcs]
+    
+    # Each ArxivClient only paces its own requests, so the two tests that hit
+    # arXiv run one after the other; the PDF and GitHub tests overlap them.
+    # Output is buffered per test and printed in order below.
+    sys.stdout = _TestStdout(sys.stdout)
+    try:
+        (arxiv_run, integration_run), pdf_run, github_run = await asyncio.gather(
+            run_in_order([test_arxiv_client, test_integration]),
+            _run_buffered(test_pdf_processor),
+            _run_buffered(test_github_analyzer)
+        )
+    finally:
+        sys.stdout = sys.stdout._stream
+        # Release the sessions and workers shared across the tests
+        await close_github_session()
+        shutdown_parse_pool()
+    
     results = []
-    for test_name, test_coro in tests:
-        try:
-            result = await test_coro
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
+    for (test_name, _), (outcome, output) in zip(tests, (arxiv_run, pdf_run, github_run, integration_run)):
+        print(output, end="")
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} test crashed: {outcome}")
             results.append((test_name, False))
+        else:
+            results.append((test_name, outcome))
     
     # Print summary
     print("\n" + "=" * 50)